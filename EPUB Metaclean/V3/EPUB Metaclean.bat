@@ -1,4 +1,4 @@
 @echo off
-pip install Pillow epubfile requests ebookmeta beautifulsoup4 selenium undetected-chromedriver 
+pip install Pillow epubfile requests ebookmeta beautifulsoup4 selenium undetected-chromedriver watchdog 
 set "pythonFile=%~dp0EPUB Metaclean.py"
 python "%pythonFile%"
\ No newline at end of file
@@ -2,25 +2,36 @@
 from tkinter import *
 from tkinter.ttk import *
 from PIL import Image, ImageTk
-import gc
 import os
 import shutil
 import epubfile
 import traceback
 import threading
-import queue
 import requests
 import re
 import ebookmeta
 import sys
+import sqlite3
+import time
+import json
+from html import unescape
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from io import BytesIO
 from time import sleep
 from bs4 import BeautifulSoup
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webelement import WebElement
 import undetected_chromedriver as uc
 
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
 # endregion
 
 
@@ -34,6 +45,7 @@ class Window:
     FONT_SIZE = 14
     DEFAULT_IMAGE_URL = "https://images.squarespace-cdn.com/content/v1/5fc7868e04dc9f2855c99940/32f738d4-e4b9-4c61-bfc0-e813699cdd3c/laura-barrett-illustrator-beloved-girls-book-cover.jpg"
     DISABLED_COLOR = "#636363"
+    FRAME_INTERVAL = 16
 
     class TopFrame:
         def __init__(self, parent):
@@ -164,7 +176,12 @@ class Window:
     def __init__(self):
         self.root = Tk()
         self.is_running = True
-        self.gui_update_queue = queue.Queue()
+        self.gui_updates = []
+        self.gui_update_keys = {}
+        self.gui_update_lock = threading.Lock()
+        self.gui_update_pending = False
+        self.gui_drain_task = None
+        self.last_gui_drain = 0
         self.style = Style()
 
         self.root.title("EPUB Metaclean V3")
@@ -266,55 +283,111 @@ class Window:
         self.right_frame.bind("<Configure>", self.auto_resize_image)
         self.update_image(self.DEFAULT_IMAGE_URL)
 
-        self.poll_updates_task = self.root.after(100, self._poll_gui_updates)
+        self.root.bind("<<GuiUpdate>>", self._schedule_gui_drain)
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _on_close(self):
         self.is_running = False
-        queue_lock = threading.Lock()
 
-        with queue_lock:
-            self.gui_update_queue = queue.Queue()
+        with self.gui_update_lock:
+            self.gui_updates = []
+            self.gui_update_keys = {}
 
-        if hasattr(self, "poll_updates_task") and self.poll_updates_task:
-            self.root.after_cancel(self.poll_updates_task)
-            self.poll_updates_task = None
+        if self.gui_drain_task:
+            self.root.after_cancel(self.gui_drain_task)
+            self.gui_drain_task = None
 
-        for obj in gc.get_objects():
-            if isinstance(obj, uc.Chrome):
-                try:
-                    obj.quit()
-                except:
-                    pass
+        search_pool.shutdown(wait=False, cancel_futures=True)
+
+        driver_pool.close()
 
         self.root.quit()
         self.root.after(100, self.root.destroy)
         sys.exit()
 
-    def _gui_update(self, func, update_idle):
+    def _gui_update(self, func):
         def wrapper(*args, **kwargs):
             if self.is_running:
-                self.gui_update_queue.put(lambda: func(*args, **kwargs))
-                self.gui_update_queue.put(lambda: update_idle())
+                self._queue_gui_update(func, args, kwargs)
 
         return wrapper
 
-    def _poll_gui_updates(self):
-        if self.is_running:
-            while not self.gui_update_queue.empty():
-                update_function = self.gui_update_queue.get()
-                update_function()
+    def _queue_gui_update(self, func, args, kwargs):
+        if func.__name__ == "update_progress_bar":
+            args, kwargs = (), {
+                "progress": args[0] if args else kwargs.get("progress", 1),
+                "override": (
+                    args[1] if len(args) > 1 else kwargs.get("override", False)
+                ),
+            }
+            key = "progress_bar"
+        elif func.__name__ == "config" and args:
+            key = ("config", str(args[0]))
+        else:
+            key = None
+
+        with self.gui_update_lock:
+            update = self.gui_update_keys.get(key) if key else None
+
+            if update and key == "progress_bar":
+                if kwargs["override"]:
+                    update[2] = kwargs
+                else:
+                    update[2]["progress"] += kwargs["progress"]
+            elif update:
+                update[2].update(kwargs)
+            else:
+                update = [func, args, kwargs]
+                self.gui_updates.append(update)
+
+                if key:
+                    self.gui_update_keys[key] = update
+                else:
+                    self.gui_update_keys = {}
+
+            if self.gui_update_pending:
+                return
+
+            self.gui_update_pending = True
 
-            self.poll_updates_task = self.root.after(
-                100, self._poll_gui_updates
+        try:
+            self.root.event_generate("<<GuiUpdate>>", when="tail")
+        except (RuntimeError, TclError):
+            with self.gui_update_lock:
+                self.gui_update_pending = False
+
+    def _schedule_gui_drain(self, event=None):
+        if self.is_running and not self.gui_drain_task:
+            elapsed = (time.monotonic() - self.last_gui_drain) * 1000
+            delay = max(0, int(self.FRAME_INTERVAL - elapsed))
+            self.gui_drain_task = self.root.after(
+                delay, self._drain_gui_updates
             )
 
+    def _drain_gui_updates(self):
+        self.gui_drain_task = None
+
+        with self.gui_update_lock:
+            updates = self.gui_updates
+            self.gui_updates = []
+            self.gui_update_keys = {}
+            self.gui_update_pending = False
+
+        if not self.is_running or not updates:
+            return
+
+        for func, args, kwargs in updates:
+            func(*args, **kwargs)
+
+        self._update_idle_tasks()
+        self.last_gui_drain = time.monotonic()
+
     def _wrap_methods(self):
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            if callable(attr) and not attr_name.startswith("_"):
-                wrapped = self._gui_update(attr, self._update_idle_tasks)
-                setattr(self, attr_name, wrapped)
+        for target in (self, self.top_frame, self.bottom_frame):
+            for attr_name in dir(target):
+                attr = getattr(target, attr_name)
+                if callable(attr) and not attr_name.startswith("_"):
+                    setattr(target, attr_name, self._gui_update(attr))
 
     def _update_idle_tasks(self):
         self.middle_frame.update_idle_tasks()
@@ -345,9 +418,7 @@ class Window:
     def update_image(self, image_url=None, image_data=None):
         if image_url or image_data:
             if image_url:
-                response = requests.get(
-                    image_url, stream=True, headers=C.HEADERS
-                )
+                response = http_session.get(image_url, timeout=30)
             self.image_original = Image.open(
                 BytesIO(response.content if image_url else image_data)
             )
@@ -399,6 +470,7 @@ class Book:
         self.file_name = None
         self.file_path = None
         self.current_directory = None
+        self.search_future = None
 
     def __str__(self):
         return f"{self.title} By {self.author}"
@@ -414,12 +486,40 @@ class Book:
         if self.series_index:
             output += f", Book #{self.series_index}\n\n"
 
-        ui.update_image(image_data=self.cover)
+        ui.update_image(image_data=self.load_cover())
 
         return output
 
-    def get_oceanofpdf_search_data(self, result):
-        result_data = result.get_attribute("outerHTML")
+    def wait_for_search_data(self):
+        if self.search_future is None:
+            return
+
+        while not self.search_future.done():
+            check_running_state()
+            sleep(0.05)
+
+        self.search_future.result()
+        self.search_future = None
+
+    def load_cover(self):
+        if self.cover is not None or not self.cover_url:
+            return self.cover
+
+        try:
+            if self.goodreads_id:
+                self.cover = goodreads_cache.fetch(
+                    "cover", self.goodreads_id, self.cover_url
+                )
+            else:
+                response = http_session.get(self.cover_url, timeout=30)
+                response.raise_for_status()
+                self.cover = response.content
+        except (requests.RequestException, LookupError):
+            pass
+
+        return self.cover
+
+    def get_oceanofpdf_search_data(self, result_data):
         soup = BeautifulSoup(result_data, "html.parser")
 
         self.title = soup.select(".entry-title-link")[0].text.strip()
@@ -431,16 +531,12 @@ class Book:
         self.cover_url = re.sub(
             r"-\d+x\d+", "", soup.select(".post-image")[0]["src"]
         )
-        self.cover = requests.get(
-            self.cover_url, stream=True, headers=C.HEADERS
-        ).content
         self.oceanofpdf_url = soup.select(".entry-title-link")[0]["href"]
         self.oceanofpdf_has_epub = (
             True if "epub" in re.split(r"[/-]", self.oceanofpdf_url) else False
         )
 
-    def get_goodreads_search_data(self, result):
-        result_data = result.get_attribute("outerHTML")
+    def get_goodreads_search_data(self, result_data):
         soup = BeautifulSoup(result_data, "html.parser")
 
         self.title = soup.select(".bookTitle")[0].text.strip()
@@ -476,14 +572,22 @@ class Book:
             + "/book/show/"
             + self.goodreads_id
         )
-        response = requests.get(self.goodreads_url)
+        try:
+            page = goodreads_cache.fetch(
+                "book", self.goodreads_id, self.goodreads_url
+            )
+            page_data = extract_goodreads_data(page)
+            self.cover_url = page_data["cover_url"]
 
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.content, "html.parser")
-            self.cover_url = soup.select(".BookCover__image")[0].select("img")[
-                0
-            ]["src"]
-            self.cover = requests.get(self.cover_url, stream=True).content
+            if not self.series and page_data["series"]:
+                self.series = page_data["series"]
+                self.series_index = (
+                    float(page_data["series_index"])
+                    if re.fullmatch(r"\d+(\.\d+)?", page_data["series_index"] or "")
+                    else None
+                )
+        except (requests.RequestException, LookupError):
+            pass
 
     def get_file_data(self, file):
         meta = ebookmeta.get_metadata(file)
@@ -566,6 +670,434 @@ class Book:
             )
 
 
+class ElementWaiter:
+    WAIT_SCRIPT = """
+        var by = arguments[0], value = arguments[1], timeout = arguments[2];
+        var root = arguments[3] || document;
+        var done = arguments[arguments.length - 1];
+
+        if (document.documentURI.indexOf("chrome-error://") === 0) {
+            done(null);
+            return;
+        }
+
+        function find() {
+            if (by !== "xpath") {
+                return Array.from(root.querySelectorAll(value));
+            }
+            var result = document.evaluate(
+                value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+            );
+            var found = [];
+            for (var i = 0; i < result.snapshotLength; i++) {
+                found.push(result.snapshotItem(i));
+            }
+            return found;
+        }
+
+        var found = find();
+        if (found.length) {
+            done(found);
+            return;
+        }
+
+        var timer = null;
+        var observer = new MutationObserver(function () {
+            var found = find();
+            if (found.length) {
+                observer.disconnect();
+                clearTimeout(timer);
+                done(found);
+            }
+        });
+        observer.observe(root.documentElement || root, {
+            childList: true,
+            subtree: true,
+            attributes: true,
+        });
+        timer = setTimeout(function () {
+            observer.disconnect();
+            done([]);
+        }, timeout);
+    """
+    CSS_LOCATORS = {
+        By.CSS_SELECTOR: "{}",
+        By.TAG_NAME: "{}",
+        By.ID: '[id="{}"]',
+        By.NAME: '[name="{}"]',
+        By.CLASS_NAME: ".{}",
+    }
+
+    def __init__(self, stats_file):
+        self.stats_file = stats_file
+        self.lock = threading.Lock()
+        self.stats = {}
+
+        try:
+            with open(stats_file, "r") as stats:
+                self.stats = json.load(stats)
+        except (OSError, ValueError):
+            self.stats = {}
+
+    def wait(self, web_driver, element, wait_time, multiple=False):
+        by, value = element
+        root = web_driver if isinstance(web_driver, WebElement) else None
+        web_driver = root.parent if root is not None else web_driver
+
+        if by == By.XPATH:
+            by = "xpath"
+        elif by in self.CSS_LOCATORS:
+            value = self.CSS_LOCATORS[by].format(value)
+            by = "css"
+        else:
+            return None
+
+        start_time = time.monotonic()
+        end_time = start_time + wait_time
+        found = []
+
+        while True:
+            check_running_state()
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+
+            timeout = min(remaining, 1)
+            try:
+                web_driver.set_script_timeout(timeout + 5)
+                found = web_driver.execute_async_script(
+                    self.WAIT_SCRIPT, by, value, int(timeout * 1000), root
+                )
+            except WebDriverException:
+                sleep(0.1)
+                continue
+
+            if found is None or found:
+                break
+
+        self.record(element, time.monotonic() - start_time, bool(found))
+
+        if not found:
+            return False
+        return found if multiple else found[0]
+
+    def record(self, element, wait_time, success):
+        key = f"{element[0]}={element[1]}"
+
+        with self.lock:
+            entry = self.stats.setdefault(
+                key, {"count": 0, "failures": 0, "total": 0.0, "max": 0.0}
+            )
+            entry["count"] += 1
+            entry["failures"] += 0 if success else 1
+            entry["total"] += wait_time
+            entry["max"] = max(entry["max"], wait_time)
+
+    def save(self):
+        with self.lock:
+            try:
+                with open(self.stats_file, "w") as stats:
+                    json.dump(self.stats, stats, indent=4)
+            except OSError:
+                pass
+
+
+class DriverPool:
+    def __init__(self, create_driver, size=1):
+        self.create_driver = create_driver
+        self.size = size
+        self.lock = threading.Lock()
+        self.idle = []
+        self.drivers = []
+
+    def is_healthy(self, web_driver):
+        try:
+            return bool(web_driver.window_handles)
+        except WebDriverException:
+            return False
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                if not self.idle:
+                    break
+                web_driver = self.idle.pop()
+
+            if self.is_healthy(web_driver):
+                web_driver.switch_to.window(web_driver.window_handles[0])
+                return web_driver
+            self.discard(web_driver)
+
+        web_driver = self.create_driver()
+        with self.lock:
+            self.drivers.append(web_driver)
+        return web_driver
+
+    def release(self, web_driver):
+        if not self.is_healthy(web_driver):
+            self.discard(web_driver)
+            return
+
+        try:
+            while len(web_driver.window_handles) > 1:
+                web_driver.switch_to.window(web_driver.window_handles[-1])
+                web_driver.close()
+            web_driver.switch_to.window(web_driver.window_handles[0])
+            web_driver.get("about:blank")
+            web_driver.minimize_window()
+        except WebDriverException:
+            self.discard(web_driver)
+            return
+
+        with self.lock:
+            if len(self.idle) < self.size:
+                self.idle.append(web_driver)
+                return
+
+        self.discard(web_driver)
+
+    def discard(self, web_driver):
+        with self.lock:
+            if web_driver in self.idle:
+                self.idle.remove(web_driver)
+            if web_driver in self.drivers:
+                self.drivers.remove(web_driver)
+
+        try:
+            web_driver.quit()
+        except (WebDriverException, OSError):
+            pass
+
+    def close(self):
+        with self.lock:
+            drivers = list(self.drivers)
+
+        for web_driver in drivers:
+            self.discard(web_driver)
+
+
+class DownloadWatcher:
+    POLL_INTERVAL = 0.25
+
+    def __init__(self, folder, extension=".epub"):
+        self.folder = folder
+        self.extension = extension
+        self.condition = threading.Condition()
+        self.finished = []
+        self.known = self.scan()
+        self.observer = None
+
+        if Observer is not None:
+            self.observer = Observer()
+            self.observer.schedule(self, folder, recursive=False)
+            self.observer.start()
+
+    def scan(self):
+        with os.scandir(self.folder) as entries:
+            return {
+                entry.name
+                for entry in entries
+                if entry.name.lower().endswith(self.extension)
+            }
+
+    def dispatch(self, event):
+        if event.is_directory or event.event_type not in ("created", "moved"):
+            return
+        self.add(getattr(event, "dest_path", None) or event.src_path)
+
+    def add(self, path):
+        name = os.path.basename(path)
+        if not name.lower().endswith(self.extension):
+            return
+
+        with self.condition:
+            if name in self.known:
+                return
+            self.known.add(name)
+            self.finished.append(name)
+            self.condition.notify_all()
+
+    def wait(self, timeout):
+        end_time = time.monotonic() + timeout
+
+        with self.condition:
+            while not self.finished:
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
+                    return None
+
+                if self.observer is None:
+                    self.condition.release()
+                    try:
+                        for name in self.scan():
+                            self.add(name)
+                    finally:
+                        self.condition.acquire()
+
+                    if self.finished:
+                        break
+
+                self.condition.wait(min(remaining, self.POLL_INTERVAL))
+
+            return self.finished.pop(0)
+
+    def stop(self):
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+
+
+class ContentScrubber:
+    GROUP_REFERENCE_PATTERN = re.compile(r"\\\\|\\(\d{1,2})|\\g<(\d+)>")
+
+    def __init__(self, rules):
+        self.rules = []
+        group = 0
+        for pattern, replacement in rules:
+            group += 1
+            self.rules.append(
+                (pattern, self.shift_references(replacement, group))
+            )
+            group += re.compile(pattern).groups
+
+        self.hits = {}
+        self.pattern = re.compile(
+            "|".join(
+                f"(?P<r{index}>{pattern})"
+                for index, (pattern, _) in enumerate(rules)
+            )
+        )
+
+    def shift_references(self, replacement, offset):
+        def shift(match):
+            number = match.group(1) or match.group(2)
+            if number is None:
+                return match.group(0)
+            return f"\\g<{int(number) + offset}>"
+
+        return self.GROUP_REFERENCE_PATTERN.sub(shift, replacement)
+
+    def replace(self, match):
+        pattern, replacement = self.rules[int(match.lastgroup[1:])]
+        self.hits[pattern] = self.hits.get(pattern, 0) + 1
+        return match.expand(replacement)
+
+    def scrub(self, text):
+        return self.pattern.sub(self.replace, text)
+
+    def reset(self):
+        hits = sum(self.hits.values())
+        self.hits = {}
+        return hits
+
+
+class GoodreadsCache:
+    def __init__(self, db_path, ttl, max_bytes, session, offline=False):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.lock = threading.Lock()
+        self.session = session
+
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                data BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL,
+                PRIMARY KEY (kind, key)
+            )
+            """
+        )
+        self.connection.commit()
+
+    def get(self, kind, key):
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT data, created FROM responses WHERE kind = ? AND key = ?",
+                (kind, str(key)),
+            ).fetchone()
+
+            if not row:
+                return None
+
+            if not self.offline and time.time() - row[1] > self.ttl:
+                self.connection.execute(
+                    "DELETE FROM responses WHERE kind = ? AND key = ?",
+                    (kind, str(key)),
+                )
+                self.connection.commit()
+                return None
+
+            self.connection.execute(
+                "UPDATE responses SET accessed = ? WHERE kind = ? AND key = ?",
+                (time.time(), kind, str(key)),
+            )
+            self.connection.commit()
+
+        return row[0]
+
+    def put(self, kind, key, data):
+        if self.offline:
+            return
+
+        now = time.time()
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, str(key), data, len(data), now, now),
+            )
+            self.evict()
+            self.connection.commit()
+
+    def fetch(self, kind, key, url):
+        key = key if key else url
+        data = self.get(kind, key)
+
+        if data is not None:
+            return data
+
+        if self.offline:
+            raise LookupError(f"No Recorded {kind} Response For {key}")
+
+        response = self.session.get(url, timeout=30)
+        response.raise_for_status()
+        self.put(kind, key, response.content)
+
+        return response.content
+
+    def evict(self):
+        total = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+        if total <= self.max_bytes:
+            return
+
+        rows = self.connection.execute(
+            "SELECT kind, key, size FROM responses ORDER BY accessed"
+        ).fetchall()
+
+        for kind, key, size in rows:
+            if total <= self.max_bytes * 0.9:
+                break
+
+            self.connection.execute(
+                "DELETE FROM responses WHERE kind = ? AND key = ?", (kind, key)
+            )
+            total -= size
+
+    def close(self):
+        with self.lock:
+            self.connection.commit()
+            self.connection.close()
+
+
 class C:
     CURRENT_FOLDER = os.getcwd()
     HEADERS = {
@@ -578,11 +1110,25 @@ class C:
     ERRORED_FOLDER = os.path.join(CURRENT_FOLDER, "Errored")
     ARCHIVE_FOLDER = os.path.join(CURRENT_FOLDER, "Archive")
     STRING_TO_REMOVE = "OceanofPDF.com"
+    CONTENT_FILTERS = [(re.escape(STRING_TO_REMOVE), "")]
+    QUERY_FILTERS = [
+        (re.escape(part), " ")
+        for part in [f"_{STRING_TO_REMOVE}_", "-", "_", "(", ")", ".epub"]
+    ]
     GOOD_READS_URL = "https://www.goodreads.com/search?q="
     GOOD_READS_DEFAULT_IMAGE = (
         "https://dryofg8nmyqjw.cloudfront.net/images/no-cover.png"
     )
     OCEANOFPDF_URL = "https://oceanofpdf.com/?s="
+    GOODREADS_FIXTURES = os.environ.get("METACLEAN_GOODREADS_FIXTURES")
+    GOODREADS_CACHE_FILE = GOODREADS_FIXTURES or os.path.join(
+        CURRENT_FOLDER, "Goodreads Cache.db"
+    )
+    GOODREADS_CACHE_TTL = 30 * 24 * 60 * 60
+    GOODREADS_CACHE_MAX_BYTES = 200 * 1024 * 1024
+    SEARCH_THREADS = 8
+    DRIVER_POOL_SIZE = 1
+    WAIT_STATS_FILE = os.path.join(CURRENT_FOLDER, "Wait Stats.json")
     DOWNLOAD_STAGES = 5
     PROCESS_STAGES = 9
     UPLOAD_STAGES = 8
@@ -615,11 +1161,7 @@ def fix_query(input_string):
     if not input_string:
         return False
 
-    replacements = [f"_{C.STRING_TO_REMOVE}_", "-", "_", "(", ")", ".epub"]
-    temp_string = input_string
-
-    for part in replacements:
-        temp_string = temp_string.replace(part, " ")
+    temp_string = query_scrubber.scrub(input_string)
 
     query_normal = " ".join(temp_string.split())
     query = "+".join(temp_string.split())
@@ -630,6 +1172,139 @@ def fix_query(input_string):
 # endregion
 
 
+# region Goodreads Extract Helpers
+LINKED_DATA_PATTERN = re.compile(
+    r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>', re.DOTALL
+)
+NEXT_DATA_PATTERN = re.compile(
+    r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL
+)
+SERIES_LINK_PATTERN = re.compile(
+    r'<a[^>]*href="https://www\.goodreads\.com/series[^"]*"[^>]*>(.*?)</a>',
+    re.DOTALL,
+)
+TITLE_SERIES_PATTERN = re.compile(r"\s*\(([^()]+?),?\s*#([\d.]+)\)\s*$")
+TAG_PATTERN = re.compile(r"<[^>]+>")
+
+
+def extract_goodreads_data(html):
+    if isinstance(html, bytes):
+        html = html.decode("utf-8", errors="ignore")
+
+    data = {
+        "title": None,
+        "author": None,
+        "series": None,
+        "series_index": None,
+        "cover_url": None,
+    }
+    read_linked_data(html, data)
+    read_next_data(html, data)
+
+    if data["series"] is None:
+        read_series_link(html, data)
+
+    if (
+        data["title"] is None
+        or data["author"] is None
+        or data["cover_url"] is None
+    ):
+        read_with_soup(html, data)
+
+    return data
+
+
+def split_series(title, data):
+    match = TITLE_SERIES_PATTERN.search(title)
+    if not match:
+        return title
+
+    if data["series"] is None:
+        data["series"] = match.group(1).strip()
+        data["series_index"] = match.group(2)
+    return title[: match.start()].strip()
+
+
+def read_linked_data(html, data):
+    for block in LINKED_DATA_PATTERN.findall(html):
+        try:
+            linked_data = json.loads(block)
+        except ValueError:
+            continue
+
+        if not isinstance(linked_data, dict) or linked_data.get("@type") != "Book":
+            continue
+
+        if linked_data.get("name"):
+            data["title"] = split_series(unescape(linked_data["name"]), data)
+
+        authors = linked_data.get("author")
+        if isinstance(authors, dict):
+            authors = [authors]
+        if authors and authors[0].get("name"):
+            data["author"] = unescape(authors[0]["name"])
+
+        if linked_data.get("image"):
+            data["cover_url"] = linked_data["image"]
+        return
+
+
+def read_next_data(html, data):
+    match = NEXT_DATA_PATTERN.search(html)
+    if not match:
+        return
+
+    try:
+        state = json.loads(match.group(1))["props"]["pageProps"]["apolloState"]
+    except (ValueError, KeyError, TypeError):
+        return
+
+    for item in state.values():
+        if not isinstance(item, dict) or item.get("__typename") != "Book":
+            continue
+        if not item.get("bookSeries"):
+            continue
+        if data["cover_url"] is not None and item.get("imageUrl") != data[
+            "cover_url"
+        ]:
+            continue
+
+        book_series = item["bookSeries"][0]
+        series = state.get(book_series.get("series", {}).get("__ref"), {})
+        if series.get("title"):
+            data["series"] = unescape(series["title"])
+            data["series_index"] = book_series.get("userPosition") or None
+        return
+
+
+def read_series_link(html, data):
+    match = SERIES_LINK_PATTERN.search(html)
+    if not match:
+        return
+
+    series_text = unescape(TAG_PATTERN.sub("", match.group(1))).split("#")
+    data["series"] = series_text[0].strip()
+    if len(series_text) > 1:
+        data["series_index"] = series_text[1].strip()
+
+
+def read_with_soup(html, data):
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.select_one(".Text__title1")
+    author = soup.select_one(".ContributorLink__name")
+    cover = soup.select_one(".BookCover__image img")
+
+    if data["title"] is None and title is not None:
+        data["title"] = title.text.strip()
+    if data["author"] is None and author is not None:
+        data["author"] = author.text.strip()
+    if data["cover_url"] is None and cover is not None:
+        data["cover_url"] = cover["src"]
+
+
+# endregion
+
+
 # region File / Folder Helpers
 def check_folders():
     thread = threading.Thread(target=check_folders_worker, daemon=True)
@@ -935,6 +1610,40 @@ def focus_driver(web_driver):
 
 
 def find_element(web_driver, element, wait_time=10, click=False):
+    end_time = time.monotonic() + wait_time
+
+    while True:
+        found_element = element_waiter.wait(
+            web_driver, element, max(end_time - time.monotonic(), 0.1)
+        )
+
+        if found_element is None:
+            return find_element_polling(web_driver, element, wait_time, click)
+
+        if not found_element or not click:
+            return found_element
+
+        try:
+            found_element.click()
+            return True
+        except WebDriverException:
+            if time.monotonic() >= end_time:
+                return False
+            sleep(0.1)
+
+
+def find_elements(web_driver, element, wait_time=10):
+    found_elements = element_waiter.wait(
+        web_driver, element, wait_time, multiple=True
+    )
+
+    if found_elements is None:
+        return find_elements_polling(web_driver, element, wait_time)
+
+    return found_elements
+
+
+def find_element_polling(web_driver, element, wait_time=10, click=False):
     time_waited = 0
 
     while time_waited <= wait_time:
@@ -956,7 +1665,7 @@ def find_element(web_driver, element, wait_time=10, click=False):
     return False
 
 
-def find_elements(web_driver, element, wait_time=10):
+def find_elements_polling(web_driver, element, wait_time=10):
     time_waited = 0
 
     while time_waited <= wait_time:
@@ -991,7 +1700,8 @@ def clear_driver_tabs(web_driver):
 # region Generic Task Function Helpers
 def end_task_function(web_driver):
     display_label()
-    web_driver.quit()
+    element_waiter.save()
+    driver_pool.release(web_driver)
     ui.top_frame.hide()
     ui.top_frame.show_task_btns()
     check_files()
@@ -1036,10 +1746,18 @@ def process_search_results(results, goodreads=False, oceanofpdf=False):
         check_running_state()
 
         book = Book()
-        book.get_goodreads_search_data(result) if goodreads else None
-        book.get_oceanofpdf_search_data(result) if oceanofpdf else None
+        result_data = result.get_attribute("outerHTML")
+        if goodreads:
+            book.search_future = search_pool.submit(
+                book.get_goodreads_search_data, result_data
+            )
+        if oceanofpdf:
+            book.search_future = search_pool.submit(
+                book.get_oceanofpdf_search_data, result_data
+            )
         books.append(book)
 
+    books[0].wait_for_search_data()
     ui.destroy(loading_label)
     return books
 
@@ -1050,6 +1768,7 @@ def book_results_menu(books, results_count):
     while True:
         check_running_state()
 
+        books[current_index].wait_for_search_data()
         book_result = display_label()
         update_label(
             book_result,
@@ -1088,6 +1807,7 @@ def download_oceanofpdf_epub(web_driver, book):
 
     focus_driver(web_driver)
     web_driver.get(book.oceanofpdf_url)
+    download_watcher = DownloadWatcher(C.SOURCE_FOLDER)
 
     if not find_element(
         web_driver,
@@ -1097,6 +1817,7 @@ def download_oceanofpdf_epub(web_driver, book):
         ),
         click=True,
     ):
+        download_watcher.stop()
         web_driver.minimize_window()
         update_label(
             subtask,
@@ -1106,31 +1827,29 @@ def download_oceanofpdf_epub(web_driver, book):
         return False
 
     web_driver.minimize_window()
+    file_name = wait_for_download(download_watcher)
+    download_watcher.stop()
 
-    if not wait_for_download(C.SOURCE_FOLDER):
+    if not file_name:
         return False
 
+    book.file_name = file_name
+    book.current_directory = C.SOURCE_FOLDER
+    book.update_file_path()
     update_label(subtask, f" - {book.title} Downloaded!")
     return True
 
 
-def wait_for_download(source_folder):
+def wait_for_download(download_watcher):
     time_waited = 0
-    old_files_count = len(
-        [f for f in os.listdir(source_folder) if f.endswith(".epub")]
-    )
 
     while True:
         check_running_state()
 
-        new_files_count = len(
-            [f for f in os.listdir(source_folder) if f.endswith(".epub")]
-        )
+        file_name = download_watcher.wait(1)
+        if file_name:
+            return file_name
 
-        if new_files_count > old_files_count:
-            return True
-
-        sleep(1)
         time_waited += 1
 
         if time_waited == 30:
@@ -1149,14 +1868,17 @@ def wait_for_download(source_folder):
 def clean_book(book_data):
     subtask = display_label(" - Cleaning Book Content...")
     book = epubfile.Epub(book_data.file_path)
+    content_scrubber.reset()
 
     for page in book.get_texts():
         soup = book.read_file(page)
-        soup = soup.replace(C.STRING_TO_REMOVE, "")
-        book.write_file(page, soup)
+        cleaned = content_scrubber.scrub(soup)
+        if cleaned != soup:
+            book.write_file(page, cleaned)
     book.save(book_data.file_path)
 
-    update_label(subtask, " - Book Content Cleaned!")
+    hits = content_scrubber.reset()
+    update_label(subtask, f" - Book Content Cleaned! ({hits} Removed)")
     return True
 
 
@@ -1465,7 +2187,7 @@ def wait_for_play_books_upload(web_driver):
 # region Task Worker Functions
 def download_new_book_worker():
     task_label = display_label("Downloading New Books...")
-    web_driver = create_chrome_driver()
+    web_driver = driver_pool.acquire()
     display_label()
 
     def download_cancelled():
@@ -1547,7 +2269,7 @@ def process_files_worker():
     files = [f for f in os.listdir(C.SOURCE_FOLDER) if f.endswith(".epub")]
     ui.config(ui.top_frame.progress_bar, maximum=C.PROCESS_STAGES * len(files))
     task_label = display_label(f"Processing {len(files)} Files...")
-    web_driver = create_chrome_driver()
+    web_driver = driver_pool.acquire()
     display_label()
 
     ui.top_frame.hide()
@@ -1643,7 +2365,7 @@ def upload_books_worker():
         update_label(task_label, " # File Upload Cancelled!", True)
         end_task_function(web_driver)
 
-    web_driver = create_chrome_driver()
+    web_driver = driver_pool.acquire()
     display_label()
     ui.top_frame.update_progress_bar()
 
@@ -1697,6 +2419,24 @@ def upload_books():
 # endregion
 
 
+http_session = requests.Session()
+http_session.headers.update(C.HEADERS)
+http_session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=C.SEARCH_THREADS, pool_maxsize=C.SEARCH_THREADS),
+)
+search_pool = ThreadPoolExecutor(max_workers=C.SEARCH_THREADS)
+driver_pool = DriverPool(create_chrome_driver, C.DRIVER_POOL_SIZE)
+element_waiter = ElementWaiter(C.WAIT_STATS_FILE)
+goodreads_cache = GoodreadsCache(
+    C.GOODREADS_CACHE_FILE,
+    C.GOODREADS_CACHE_TTL,
+    C.GOODREADS_CACHE_MAX_BYTES,
+    http_session,
+    offline=C.GOODREADS_FIXTURES is not None,
+)
+content_scrubber = ContentScrubber(C.CONTENT_FILTERS)
+query_scrubber = ContentScrubber(C.QUERY_FILTERS)
 ui = Window()
 setup()
 ui.root.mainloop()
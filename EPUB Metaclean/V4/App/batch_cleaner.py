@@ -0,0 +1,95 @@
+import queue
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from epub_rewriter import EpubRewriter
+from content_scrubber import ContentScrubber
+
+worker_queue = None
+
+
+def initWorker(progress_queue):
+    global worker_queue
+    worker_queue = progress_queue
+
+
+def cleanBookFile(file_path, content_filters):
+    book_file = EpubRewriter(file_path)
+    scrubber = ContentScrubber(content_filters)
+    book_file.addTextFilter(scrubber.scrub)
+
+    book_file.save(
+        lambda done, total: worker_queue.put((file_path, done, total))
+    )
+    return dict(scrubber.hits)
+
+
+class BatchCleaner(QObject):
+    POLL_INTERVAL = 50
+
+    progress = pyqtSignal(str, int, int)
+    bookFinished = pyqtSignal(str, str, object)
+    finished = pyqtSignal()
+
+    def __init__(self, content_filters, max_workers=None):
+        super().__init__()
+        self.content_filters = content_filters
+        self.max_workers = max_workers
+        self.progress_queue = multiprocessing.Queue()
+        self.executor = None
+        self.futures = {}
+        self.hits = Counter()
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(self.POLL_INTERVAL)
+        self.poll_timer.timeout.connect(self.poll)
+
+    def start(self, file_paths):
+        if not file_paths:
+            QTimer.singleShot(0, self.finished.emit)
+            return
+
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=initWorker,
+            initargs=(self.progress_queue,),
+        )
+        for file_path in file_paths:
+            future = self.executor.submit(
+                cleanBookFile, file_path, self.content_filters
+            )
+            self.futures[future] = file_path
+
+        self.poll_timer.start()
+
+    def poll(self):
+        while True:
+            try:
+                file_path, done, total = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.progress.emit(file_path, done, total)
+
+        for future in [f for f in self.futures if f.done()]:
+            file_path = self.futures.pop(future)
+            error = future.exception() if not future.cancelled() else None
+            hits = {}
+            if not future.cancelled() and error is None:
+                hits = future.result()
+                self.hits.update(hits)
+            self.bookFinished.emit(file_path, str(error) if error else "", hits)
+
+        if not self.futures:
+            self.stop()
+            self.finished.emit()
+
+    def stop(self):
+        self.poll_timer.stop()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def cancel(self):
+        self.futures = {}
+        self.stop()
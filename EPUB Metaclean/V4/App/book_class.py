@@ -1,10 +1,13 @@
 import os
+import requests
 import ebookmeta
 import epubfile
-from helper_functions import resizeCoverImage
-from bs4 import XMLParsedAsHTMLWarning, BeautifulSoup
+from globals import G
+from helper_functions import resizeCoverImage, createThumbnail
+from epub_rewriter import EpubRewriter
+from goodreads_extractor import extractGoodreadsData
+from bs4 import XMLParsedAsHTMLWarning
 import warnings
-import requests
 
 warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
 
@@ -16,10 +19,11 @@ class Book:
         self.author = None
         self.series = None
         self.series_index = None
-        self.cover = None
+        self.cover_hash = None
         self.cover_id = None
+        self.thumbnail = None
         self.cover_url = None
-        self.goodreads_cover = None
+        self.goodreads_cover_hash = None
         self.file_name = None
         self.file_path = None
         self.oceanofpdf_url = None
@@ -27,7 +31,10 @@ class Book:
         self.book_lists = []
         self.download = None
         self.download_engine = None
+        self.download_attempts = 0
+        self.http_failed = False
         self.cleaned = False
+        self.scrub_hits = {}
         self.meta_updated = False
         self.del_action = None
         self.requeue = False
@@ -42,6 +49,35 @@ class Book:
             return self.file_path == other.file_path
         return self.title == other.title
 
+    @property
+    def cover(self):
+        return G.cover_store.get(self.coverHash())
+
+    @cover.setter
+    def cover(self, value):
+        self.cover_hash = G.cover_store.put(value)
+
+    @property
+    def goodreads_cover(self):
+        return G.cover_store.get(self.goodreads_cover_hash)
+
+    @goodreads_cover.setter
+    def goodreads_cover(self, value):
+        self.goodreads_cover_hash = G.cover_store.put(value)
+
+    def coverHash(self):
+        if self.cover_hash is None and self.cover_id is not None:
+            self.cover_hash = G.cover_store.put(self.loadCover())
+        return self.cover_hash
+
+    def loadCover(self):
+        try:
+            book = EpubRewriter(self.file_path)
+            return book.readFile(self.cover_id)
+        except Exception as e:
+            print(f"Error loading cover: {e}")
+            return None
+
     def getFileData(self, file_path):
         self.file_path = os.path.normpath(file_path)
         self.file_name = os.path.basename(self.file_path)
@@ -50,6 +86,13 @@ class Book:
             print("Testing")
             return
 
+        if G.book_index is not None:
+            entry = G.book_index.get(self.file_path)
+            if entry is not None:
+                for field, value in entry.items():
+                    setattr(self, field, value)
+                return
+
         try:
             meta = ebookmeta.get_metadata(self.file_path)
             book = epubfile.Epub(self.file_path)
@@ -61,7 +104,9 @@ class Book:
 
             self.cover_id = self.getCoverID(book)
             if self.cover_id is not None:
-                self.cover = resizeCoverImage(book.read_file(self.cover_id))
+                self.thumbnail = createThumbnail(
+                    book.read_file(self.cover_id), G.THUMBNAIL_SIZE
+                )
 
             if self.title is None:
                 self.title = self.file_name
@@ -70,6 +115,9 @@ class Book:
             print(f"Error loading metadata: {e}")
             self.is_epub = False
 
+        if G.book_index is not None:
+            G.book_index.put(self)
+
     def getCoverID(self, book):
         false_positives = ["images/cover.png"]
         possible_tags = [
@@ -95,63 +143,46 @@ class Book:
 
         return None
 
-    def getGoodreadsData(self, html, finished_action=None):
-        total_steps = 8
+    def getGoodreadsData(
+        self, html, finished_action=None, goodreads_id=None, data=None
+    ):
+        total_steps = 4
         self.list_item.progress_bar.config(value=0, text="Scrapping Data...")
         self.list_item.progress_bar.show()
 
-        soup = BeautifulSoup(html, "html.parser")
+        if data is None:
+            data = G.goodreads_cache.getJson("meta", goodreads_id)
+        if data is None:
+            data = extractGoodreadsData(html)
+            G.goodreads_cache.putJson("meta", goodreads_id, data)
+
         self.list_item.progress_bar.updateProgress(
             1, total_steps, "Scraping Title..."
         )
-
-        self.title = soup.select(".Text__title1")[0].text.strip()
+        self.title = data["title"] or self.title
+        self.author = data["author"] or self.author
         self.list_item.updateData()
-        self.list_item.progress_bar.updateProgress(
-            2, total_steps, "Scraping Author..."
-        )
 
-        self.author = soup.select(".ContributorLink__name")[0].text.strip()
-        self.list_item.updateData()
         self.list_item.progress_bar.updateProgress(
-            3, total_steps, "Scraping Series..."
-        )
-
-        series_text = soup.select_one(
-            'a[href^="https://www.goodreads.com/series"]'
+            2, total_steps, "Scraping Series..."
         )
-        if series_text:
-            series_text = series_text.get_text(strip=True)
-            series_text = series_text.split("#")
-            self.series = series_text[0].strip()
+        if data["series"] is not None:
+            self.series = data["series"]
+            if data["series_index"] is not None:
+                self.series_index = data["series_index"]
             self.list_item.updateData()
-            if len(series_text) > 1:
-                self.list_item.progress_bar.updateProgress(
-                    4, total_steps, "Scraping Series Index..."
-                )
-                self.series_index = series_text[1].strip()
-                self.list_item.updateData()
-
-        self.list_item.progress_bar.updateProgress(
-            5, total_steps, "Saving Metadata..."
-        )
-        self.saveMetadata()
 
-        if self.cover_id is not None:
+        if self.cover_id is not None and data["cover_url"] is not None:
             self.list_item.progress_bar.updateProgress(
-                6, total_steps, "Scraping Cover Url..."
-            )
-
-            self.cover_url = soup.select(".BookCover__image")[0].select("img")[
-                0
-            ]["src"]
-            self.list_item.progress_bar.updateProgress(
-                7, total_steps, "Downloading Cover..."
-            )
-
-            self.goodreads_cover = resizeCoverImage(
-                requests.get(self.cover_url, stream=True).content
+                3, total_steps, "Downloading Cover..."
             )
+            self.cover_url = data["cover_url"]
+            try:
+                self.goodreads_cover = G.goodreads_cache.fetch(
+                    "cover", goodreads_id, self.cover_url
+                )
+            except (requests.RequestException, LookupError) as e:
+                print(f"Error downloading Goodreads cover: {e}")
 
         self.list_item.progress_bar.updateProgress(
             total_steps, total_steps, "Finished"
@@ -164,39 +195,40 @@ class Book:
         if not self.file_path:
             raise ValueError("No file path set for the book.")
 
-        meta = ebookmeta.get_metadata(self.file_path)
-
-        meta.title = self.title
-        meta.set_author_list_from_string(self.author)
-        meta.series = self.series
-        meta.series_index = self.series_index
-
         try:
-            ebookmeta.set_metadata(self.file_path, meta)
-
-            if self.cover_id is not None:
-                book = epubfile.Epub(self.file_path)
-                book.write_file(self.cover_id, self.cover)
-                book.save(self.file_path)
+            book = EpubRewriter(self.file_path)
+            book.setMetadata(
+                self.title, self.author, self.series, self.series_index
+            )
+            cover = self.cover
+            if self.cover_id is not None and cover is not None:
+                book.writeFile(self.cover_id, resizeCoverImage(cover))
+            book.save()
+
+            if G.book_index is not None:
+                G.book_index.put(self)
+                G.book_index.commit()
         except Exception as e:
             print(f"Error saving metadata: {e}")
 
     def saveCover(self):
         try:
-            if self.cover_id is not None:
-                book = epubfile.Epub(self.file_path)
-                book.write_file(self.cover_id, self.cover)
-                book.save(self.file_path)
+            cover = self.cover
+            if self.cover_id is not None and cover is not None:
+                book = EpubRewriter(self.file_path)
+                book.writeFile(self.cover_id, resizeCoverImage(cover))
+                book.save()
         except Exception as e:
             print(f"Error saving metadata: {e}")
 
-    def deleteBook(self, delete_file=False):
+    def deleteBook(self, delete_file=False, commit=True):
         for list in self.book_lists:
             if self in list:
                 list.remove(self)
 
         if self.download_engine is not None:
-            self.download_engine.delete()
+            self.download_engine.loadedDone()
+            self.download_engine.stop()
 
         if self.download:
             self.download.cancel()
@@ -207,6 +239,11 @@ class Book:
             except FileNotFoundError:
                 pass
 
+            if G.book_index is not None:
+                G.book_index.remove(self.file_path)
+                if commit:
+                    G.book_index.commit()
+
         if self.list_item is not None:
             self.list_item.delete()
 
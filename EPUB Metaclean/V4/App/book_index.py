@@ -0,0 +1,101 @@
+import os
+import sqlite3
+import threading
+
+
+class BookIndex:
+    FIELDS = (
+        "title",
+        "author",
+        "series",
+        "series_index",
+        "cover_id",
+        "thumbnail",
+        "is_epub",
+    )
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            self.db_path, check_same_thread=False
+        )
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS books (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime INTEGER NOT NULL,
+                title TEXT,
+                author TEXT,
+                series TEXT,
+                series_index TEXT,
+                cover_id TEXT,
+                thumbnail BLOB,
+                is_epub INTEGER NOT NULL
+            )
+            """
+        )
+        self.connection.commit()
+
+    def fileStamp(self, file_path):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def get(self, file_path):
+        stamp = self.fileStamp(file_path)
+        if stamp is None:
+            return None
+
+        with self.lock:
+            row = self.connection.execute(
+                f"SELECT {', '.join(self.FIELDS)} FROM books "
+                "WHERE path = ? AND size = ? AND mtime = ?",
+                (file_path, *stamp),
+            ).fetchone()
+        if row is None:
+            return None
+
+        entry = dict(zip(self.FIELDS, row))
+        entry["is_epub"] = bool(entry["is_epub"])
+        return entry
+
+    def put(self, book):
+        stamp = self.fileStamp(book.file_path)
+        if stamp is None:
+            return
+
+        with self.lock:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO books (path, size, mtime, {', '.join(self.FIELDS)}) "
+                f"VALUES (?, ?, ?, {', '.join('?' for _ in self.FIELDS)})",
+                (
+                    book.file_path,
+                    *stamp,
+                    book.title,
+                    book.author,
+                    book.series,
+                    None if book.series_index is None else str(book.series_index),
+                    book.cover_id,
+                    book.thumbnail,
+                    int(book.is_epub),
+                ),
+            )
+
+    def remove(self, file_path):
+        with self.lock:
+            self.connection.execute(
+                "DELETE FROM books WHERE path = ?", (file_path,)
+            )
+
+    def commit(self):
+        with self.lock:
+            self.connection.commit()
+
+    def close(self):
+        with self.lock:
+            self.connection.commit()
+            self.connection.close()
@@ -0,0 +1,367 @@
+from PyQt5.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    QRect,
+    QRectF,
+    QSize,
+    QEvent,
+)
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt5.QtGui import QColor, QPainter
+from qt_overrides import IMAGE_CACHE
+from globals import G
+
+
+class ItemProgress:
+    def __init__(self, item):
+        self.item = item
+        self.visible = False
+        self.current = 0
+        self.total = 100
+        self.text = None
+
+    def config(self, value=None, range=None, text=None):
+        if value is not None:
+            self.current = value
+
+        if range is not None:
+            self.total = range
+
+        if text is not None:
+            self.text = text
+
+        self.item.changed()
+
+    def updateProgress(self, value, total, text=None):
+        current = int((value / total) * 100) if total > 0 else self.current
+        text = text if text is not None else self.text
+        if current == self.current and text == self.text:
+            return
+
+        self.current = current
+        self.text = text
+        if self.current >= self.total:
+            self.visible = False
+        self.item.changed()
+
+    def setValue(self, value):
+        self.config(value=value)
+
+    def value(self):
+        return self.current
+
+    def maximum(self):
+        return self.total
+
+    def percent(self):
+        return int(self.current / self.total * 100) if self.total else 0
+
+    def format(self):
+        if self.text is None:
+            return f"{self.percent()}%"
+        return f"{self.text}: {self.percent()}%"
+
+    def show(self):
+        self.visible = True
+        self.item.changed()
+
+    def hide(self):
+        self.visible = False
+        self.item.changed()
+
+    def isVisible(self):
+        return self.visible
+
+
+class BookItem:
+    def __init__(self, ui, book, insert_index):
+        self.ui = ui
+        self.book = book
+        self.theme = None
+        self.row = None
+        self.progress_bar = ItemProgress(self)
+        self.model = ui.book_list_model
+        self.model.insertItem(insert_index, self)
+
+    def changed(self):
+        self.model.itemChanged(self)
+
+    def updateData(self):
+        if self.progress_bar.value() == self.progress_bar.maximum():
+            self.progress_bar.visible = False
+        self.changed()
+
+    def setTheme(self, theme=None):
+        self.theme = theme
+        self.changed()
+
+    def showRequeue(self):
+        if G.download_worker or G.upload_worker:
+            return False
+        return bool(self.book.meta_updated) and not self.book.requeue
+
+    def lines(self):
+        lines = [self.book.title or self.book.file_name]
+        if self.book.author is not None:
+            lines.append(f"Author: {self.book.author}")
+        if self.book.series is not None:
+            lines.append(f"Series: {self.book.series}")
+        if self.book.series_index is not None:
+            lines.append(f"Book: #{self.book.series_index}")
+        return lines
+
+    def showCover(self):
+        self.ui.confirmAction(
+            title=self.book.title, image=self.book.coverHash(), info=True
+        )
+
+    def deleteBook(self):
+        cover = self.book.coverHash()
+        self.ui.confirmAction(
+            "Deleting Book",
+            "Would you like to delete the source file?",
+            lambda: (self.book.deleteBook(True)),
+            lambda: (self.book.deleteBook(False)),
+            warn_text=True,
+            warn_true=True,
+            image=cover,
+        )
+
+    def requeueBook(self):
+        self.book.requeue = True
+        self.changed()
+
+    def delete(self):
+        self.model.removeItem(self)
+
+
+class BookListModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self.items[index.row()]
+        if role == Qt.UserRole:
+            return item
+        if role == Qt.DisplayRole:
+            return item.book.title
+        return None
+
+    def insertItem(self, index, item):
+        index = max(0, min(index, len(self.items)))
+        self.beginInsertRows(QModelIndex(), index, index)
+        self.items.insert(index, item)
+        self.endInsertRows()
+        item.row = QPersistentModelIndex(self.index(index))
+
+    def removeItem(self, item):
+        if item.row is None or not item.row.isValid():
+            return
+        row = item.row.row()
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.items[row]
+        self.endRemoveRows()
+        item.row = None
+
+    def itemChanged(self, item):
+        if item.row is None or not item.row.isValid():
+            return
+        index = self.index(item.row.row())
+        self.dataChanged.emit(index, index)
+
+    def clear(self):
+        self.beginResetModel()
+        self.items = []
+        self.endResetModel()
+
+
+class BookItemDelegate(QStyledItemDelegate):
+    SPACING = 5
+    PROGRESS_LINES = 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hover = None
+
+    def color(self, name):
+        return QColor(G.STYLE_VARIABLES[name])
+
+    def radius(self):
+        return int(G.STYLE_VARIABLES["border_radius"].replace("px", ""))
+
+    def sizeHint(self, option, index):
+        margin = G.DEFAULT_MARGINS[1] + G.DEFAULT_MARGINS[3]
+        line_height = option.fontMetrics.height()
+        height = max(G.THUMBNAIL_SIZE[1], line_height * (4 + self.PROGRESS_LINES))
+        return QSize(option.rect.width(), height + margin + self.SPACING)
+
+    def buttonWidth(self, option):
+        return option.fontMetrics.horizontalAdvance(" 🗑 ") + 2 * self.SPACING
+
+    def layout(self, option, item):
+        left, top, right, bottom = G.DEFAULT_MARGINS
+        rect = option.rect.adjusted(left, top, -right, -bottom - self.SPACING)
+        button_width = self.buttonWidth(option)
+        rects = {}
+        x = rect.left()
+
+        if item.showRequeue():
+            rects["requeue"] = QRect(x, rect.top(), button_width, rect.height())
+            x += button_width + self.SPACING
+
+        if item.book.thumbnail:
+            rects["cover"] = QRect(
+                x, rect.top(), G.THUMBNAIL_SIZE[0], rect.height()
+            )
+            x += G.THUMBNAIL_SIZE[0] + self.SPACING
+
+        rects["delete"] = QRect(
+            rect.right() - button_width + 1,
+            rect.top(),
+            button_width,
+            rect.height(),
+        )
+        rects["details"] = QRect(
+            x,
+            rect.top(),
+            rects["delete"].left() - self.SPACING - x,
+            rect.height(),
+        )
+        return rects
+
+    def paint(self, painter, option, index):
+        item = index.data(Qt.UserRole)
+        rects = self.layout(option, item)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        highlight = item.theme == "highlight"
+        radius = self.radius()
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+
+        if hovered:
+            painter.setBrush(self.color("bg_color"))
+        elif highlight:
+            painter.setBrush(self.color("primary_color"))
+        else:
+            painter.setBrush(self.color("bg_alt_color"))
+        painter.drawRoundedRect(
+            QRectF(option.rect.adjusted(0, 0, 0, -self.SPACING)), radius, radius
+        )
+
+        if "cover" in rects:
+            self.paintCover(painter, rects["cover"], item)
+
+        text_color = (
+            "btn_text_alt_color" if highlight and not hovered else "primary_color"
+        )
+        self.paintDetails(painter, option, rects["details"], item, text_color)
+
+        if "requeue" in rects:
+            self.paintButton(painter, rects["requeue"], " ↺ ", index, "requeue")
+        self.paintButton(painter, rects["delete"], " 🗑 ", index, "delete")
+
+        painter.restore()
+
+    def paintCover(self, painter, rect, item):
+        pixmap = IMAGE_CACHE.pixmap(item.book.thumbnail, rect.size())
+        if pixmap is None:
+            return
+
+        x = rect.left() + (rect.width() - pixmap.width()) // 2
+        y = rect.top() + (rect.height() - pixmap.height()) // 2
+        painter.drawPixmap(x, y, pixmap)
+
+    def paintDetails(self, painter, option, rect, item, text_color):
+        line_height = option.fontMetrics.height()
+        painter.setPen(self.color(text_color))
+        y = rect.top()
+
+        for line in item.lines():
+            text = option.fontMetrics.elidedText(
+                line, Qt.ElideRight, rect.width()
+            )
+            painter.drawText(
+                QRect(rect.left(), y, rect.width(), line_height),
+                Qt.AlignLeft | Qt.AlignVCenter,
+                text,
+            )
+            y += line_height
+
+        if item.progress_bar.isVisible():
+            bar = QRect(
+                rect.left(),
+                rect.bottom() - line_height + 1,
+                rect.width(),
+                line_height,
+            )
+            self.paintProgress(painter, bar, item.progress_bar)
+
+    def paintProgress(self, painter, rect, progress):
+        radius = self.radius()
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.color("secondary_color"))
+        painter.drawRoundedRect(QRectF(rect), radius, radius)
+
+        chunk = QRect(rect)
+        chunk.setWidth(int(rect.width() * progress.percent() / 100))
+        painter.setBrush(self.color("primary_color"))
+        painter.drawRoundedRect(QRectF(chunk), radius, radius)
+
+        painter.setPen(self.color("btn_text_color"))
+        painter.drawText(rect, Qt.AlignCenter, progress.format())
+
+    def paintButton(self, painter, rect, text, index, name):
+        hovered = self.hover == (index.row(), name)
+        radius = self.radius()
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(
+            self.color("warn_color" if hovered else "secondary_color")
+        )
+        painter.drawRoundedRect(QRectF(rect), radius, radius)
+        painter.setPen(
+            self.color("btn_text_alt_color" if hovered else "warn_color")
+        )
+        painter.drawText(rect, Qt.AlignCenter, text)
+
+    def hitTest(self, option, item, pos):
+        for name, rect in self.layout(option, item).items():
+            if name != "details" and rect.contains(pos):
+                return name
+        return None
+
+    def editorEvent(self, event, model, option, index):
+        item = index.data(Qt.UserRole)
+        if item is None:
+            return False
+
+        if event.type() == QEvent.MouseMove:
+            hover = self.hitTest(option, item, event.pos())
+            hover = (index.row(), hover) if hover else None
+            if hover != self.hover:
+                self.hover = hover
+                self.parent().viewport().update()
+            return False
+
+        if event.type() != QEvent.MouseButtonRelease:
+            return False
+        if event.button() != Qt.LeftButton:
+            return False
+
+        target = self.hitTest(option, item, event.pos())
+        if target == "delete":
+            item.deleteBook()
+        elif target == "requeue":
+            item.requeueBook()
+        elif target == "cover":
+            item.showCover()
+        return target is not None
@@ -0,0 +1,61 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from book_class import Book
+
+
+class BookLoadTask(QRunnable):
+    def __init__(self, loader, file_path, generation):
+        super().__init__()
+        self.loader = loader
+        self.file_path = file_path
+        self.generation = generation
+
+    def run(self):
+        try:
+            book = Book(self.file_path)
+        except Exception as e:
+            print(f"Error loading book: {e}")
+            book = None
+        self.loader.taskDone.emit(book, self.generation)
+
+
+class BookLoader(QObject):
+    taskDone = pyqtSignal(object, int)
+    bookLoaded = pyqtSignal(object)
+    finished = pyqtSignal()
+
+    def __init__(self, max_threads=None):
+        super().__init__()
+        self.pool = QThreadPool(self)
+        if max_threads is not None:
+            self.pool.setMaxThreadCount(max_threads)
+
+        self.generation = 0
+        self.pending = 0
+        self.taskDone.connect(self.handleTaskDone)
+
+    def load(self, file_paths):
+        for file_path in file_paths:
+            self.pending += 1
+            self.pool.start(BookLoadTask(self, file_path, self.generation))
+
+        if not file_paths and not self.pending:
+            self.finished.emit()
+
+    def handleTaskDone(self, book, generation):
+        if generation != self.generation:
+            return
+
+        self.pending -= 1
+        if book is not None:
+            self.bookLoaded.emit(book)
+
+        if not self.pending:
+            self.finished.emit()
+
+    def cancel(self):
+        self.pool.clear()
+        self.generation += 1
+        self.pending = 0
+
+    def isLoading(self):
+        return self.pending > 0
@@ -0,0 +1,129 @@
+from bisect import bisect_left, bisect_right
+
+
+class BookRegistry:
+    def __init__(self):
+        self.books = []
+        self.keys = []
+        self.book_keys = {}
+        self.paths = {}
+        self.slugs = {}
+        self.titles = {}
+        self.untracked = {}
+        self.indexed = {}
+
+    def __iter__(self):
+        return iter(list(self.books))
+
+    def __len__(self):
+        return len(self.books)
+
+    def __bool__(self):
+        return bool(self.books)
+
+    def __getitem__(self, index):
+        return self.books[index]
+
+    def __contains__(self, book):
+        return self.find(book) is not None
+
+    def hasBook(self, book):
+        return id(book) in self.book_keys
+
+    def find(self, book):
+        if id(book) in self.book_keys:
+            return book
+
+        if book.file_path is not None:
+            match = self.paths.get(book.file_path)
+            if match is None:
+                match = self.firstTitle(self.untracked, book.title)
+            return match
+
+        return self.firstTitle(self.titles, book.title)
+
+    def firstTitle(self, titles, title):
+        books = titles.get(title)
+        return next(iter(books.values())) if books else None
+
+    def sortKey(self, book):
+        return book.title.lower() if book.title else ""
+
+    def slug(self, url):
+        return url.split("/")[-2]
+
+    def add(self, book):
+        key = self.sortKey(book)
+        index = bisect_right(self.keys, key)
+        self.books.insert(index, book)
+        self.keys.insert(index, key)
+        self.book_keys[id(book)] = key
+        self.indexBook(book)
+        return index
+
+    def indexBook(self, book):
+        path = book.file_path
+        title = book.title
+        slug = None
+        if path is not None:
+            self.paths[path] = book
+        else:
+            self.untracked.setdefault(title, {})[id(book)] = book
+        if book.oceanofpdf_url is not None:
+            slug = self.slug(book.oceanofpdf_url)
+            self.slugs[slug] = book
+        self.titles.setdefault(title, {})[id(book)] = book
+        self.indexed[id(book)] = path, slug, title
+
+    def unindexBook(self, book):
+        path, slug, title = self.indexed.pop(id(book), (None, None, None))
+        if self.paths.get(path) is book:
+            del self.paths[path]
+        if self.slugs.get(slug) is book:
+            del self.slugs[slug]
+        for titles in (self.titles, self.untracked):
+            books = titles.get(title)
+            if books is not None:
+                books.pop(id(book), None)
+                if not books:
+                    del titles[title]
+
+    def reindex(self, book):
+        if id(book) not in self.book_keys:
+            return
+        self.unindexBook(book)
+        self.indexBook(book)
+
+    def position(self, book):
+        key = self.book_keys[id(book)]
+        index = bisect_left(self.keys, key)
+        while self.books[index] is not book:
+            index += 1
+        return index
+
+    def remove(self, book):
+        book = self.find(book)
+        if book is None:
+            raise ValueError("Book not in registry")
+
+        index = self.position(book)
+        del self.books[index]
+        del self.keys[index]
+        del self.book_keys[id(book)]
+        self.unindexBook(book)
+
+    def clear(self):
+        self.books.clear()
+        self.keys.clear()
+        self.book_keys.clear()
+        self.paths.clear()
+        self.slugs.clear()
+        self.titles.clear()
+        self.untracked.clear()
+        self.indexed.clear()
+
+    def findPath(self, file_path):
+        return self.paths.get(file_path)
+
+    def findSlug(self, url):
+        return self.slugs.get(self.slug(url))
@@ -0,0 +1,49 @@
+import re
+from collections import Counter
+
+GROUP_REFERENCE_PATTERN = re.compile(r"\\\\|\\(\d{1,2})|\\g<(\d+)>")
+
+
+def shiftReferences(replacement, offset):
+    def shift(match):
+        number = match.group(1) or match.group(2)
+        if number is None:
+            return match.group(0)
+        return f"\\g<{int(number) + offset}>"
+
+    return GROUP_REFERENCE_PATTERN.sub(shift, replacement)
+
+
+class ContentScrubber:
+    def __init__(self, rules):
+        self.rules = []
+        group = 0
+        for rule in rules:
+            pattern, replacement = rule[0], rule[1]
+            name = rule[2] if len(rule) > 2 else pattern
+            group += 1
+            self.rules.append(
+                (pattern, shiftReferences(replacement, group), name)
+            )
+            group += re.compile(pattern).groups
+
+        self.hits = Counter()
+        self.pattern = None
+        if self.rules:
+            self.pattern = re.compile(
+                "|".join(
+                    f"(?P<r{index}>{pattern})"
+                    for index, (pattern, _, _) in enumerate(self.rules)
+                )
+            )
+
+    def replace(self, match):
+        index = int(match.lastgroup[1:])
+        _, replacement, name = self.rules[index]
+        self.hits[name] += 1
+        return match.expand(replacement)
+
+    def scrub(self, text):
+        if self.pattern is None:
+            return text
+        return self.pattern.sub(self.replace, text)
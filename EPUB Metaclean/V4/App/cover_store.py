@@ -0,0 +1,99 @@
+import os
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from PyQt5.QtCore import QByteArray
+from PyQt5.QtGui import QPixmap
+
+
+class CoverStore:
+    def __init__(self, location, max_items=8, max_pixmaps=4):
+        self.location = location
+        self.max_items = max_items
+        self.max_pixmaps = max_pixmaps
+        self.recent = OrderedDict()
+        self.pixmaps = OrderedDict()
+        self.lock = threading.Lock()
+        os.makedirs(self.location, exist_ok=True)
+
+    def coverPath(self, cover_hash):
+        return os.path.join(self.location, cover_hash[:2], cover_hash + ".img")
+
+    def put(self, data):
+        if not data:
+            return None
+
+        data = bytes(data)
+        cover_hash = hashlib.sha1(data).hexdigest()
+        cover_path = self.coverPath(cover_hash)
+        with self.lock:
+            if not os.path.exists(cover_path):
+                os.makedirs(os.path.dirname(cover_path), exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(
+                    dir=os.path.dirname(cover_path)
+                )
+                with os.fdopen(fd, "wb") as output:
+                    output.write(data)
+                os.replace(temp_path, cover_path)
+            self.remember(cover_hash, data)
+        return cover_hash
+
+    def get(self, cover_hash):
+        if cover_hash is None:
+            return None
+
+        with self.lock:
+            data = self.recent.get(cover_hash)
+            if data is not None:
+                self.recent.move_to_end(cover_hash)
+                return data
+
+            try:
+                with open(self.coverPath(cover_hash), "rb") as cover:
+                    data = cover.read()
+            except OSError as e:
+                print(f"Error reading stored cover: {e}")
+                return None
+
+            self.remember(cover_hash, data)
+            return data
+
+    def remember(self, cover_hash, data):
+        self.recent[cover_hash] = data
+        self.recent.move_to_end(cover_hash)
+        while len(self.recent) > self.max_items:
+            self.recent.popitem(last=False)
+
+    def pixmap(self, cover_hash):
+        if cover_hash is None:
+            return None
+
+        pixmap = self.pixmaps.get(cover_hash)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(cover_hash)
+            return pixmap
+
+        data = self.get(cover_hash)
+        pixmap = QPixmap()
+        if not data or not pixmap.loadFromData(QByteArray(data)):
+            return None
+
+        self.pixmaps[cover_hash] = pixmap
+        while len(self.pixmaps) > self.max_pixmaps:
+            self.pixmaps.popitem(last=False)
+        return pixmap
+
+    def close(self, keep=()):
+        with self.lock:
+            self.recent.clear()
+            self.pixmaps.clear()
+            for folder, _, files in os.walk(self.location):
+                for name in files:
+                    cover_hash, _ = os.path.splitext(name)
+                    if cover_hash in keep:
+                        continue
+                    try:
+                        os.remove(os.path.join(folder, name))
+                    except OSError as e:
+                        print(f"Error removing stored cover: {e}")
@@ -0,0 +1,227 @@
+import psutil
+from collections import deque
+from PyQt5.QtCore import QObject, QTimer
+from globals import G
+from qt_overrides import WebEngineView
+
+
+class DownloadQueue:
+    def __init__(self):
+        self.queues = {}
+
+    def __len__(self):
+        return sum(len(q) for q in self.queues.values())
+
+    def __bool__(self):
+        return any(self.queues.values())
+
+    def __contains__(self, book):
+        return any(b is book for q in self.queues.values() for b in q)
+
+    def append(self, book, priority=0):
+        self.queues.setdefault(priority, deque()).append(book)
+
+    def popleft(self):
+        for priority in sorted(self.queues, reverse=True):
+            if self.queues[priority]:
+                return self.queues[priority].popleft()
+        raise IndexError("pop from an empty queue")
+
+    def remove(self, book):
+        for q in self.queues.values():
+            for index, queued in enumerate(q):
+                if queued is book:
+                    del q[index]
+                    return
+        raise ValueError("Book not in queue")
+
+    def clear(self):
+        self.queues = {}
+
+
+class EnginePool:
+    def __init__(self, parent, size=0):
+        self.parent = parent
+        self.idle = deque()
+        self.busy = set()
+        self.warm(size)
+
+    def __len__(self):
+        return len(self.idle) + len(self.busy)
+
+    def engines(self):
+        return list(self.idle) + list(self.busy)
+
+    def createEngine(self):
+        engine = WebEngineView(self.parent)
+        engine.setUrl("about:blank")
+        return engine
+
+    def warm(self, size):
+        while len(self) < size:
+            self.idle.append(self.createEngine())
+
+    def acquire(self):
+        engine = self.idle.popleft() if self.idle else self.createEngine()
+        self.busy.add(engine)
+        return engine
+
+    def release(self, engine):
+        if engine not in self.busy:
+            return
+        self.busy.discard(engine)
+        engine.loadedDone()
+        engine.stop()
+        self.idle.append(engine)
+
+    def trim(self, size):
+        while self.idle and len(self) > size:
+            self.idle.pop().delete()
+
+    def clear(self):
+        for engine in self.engines():
+            engine.delete()
+        self.idle.clear()
+        self.busy.clear()
+
+
+class DownloadScheduler(QObject):
+    def __init__(self, engine_parent, start_download):
+        super().__init__()
+        self.start_download = start_download
+        self.running = True
+        self.queue = DownloadQueue()
+        self.active = {}
+        self.limit = G.DOWNLOAD_START_LIMIT
+        self.pool = EnginePool(engine_parent, self.limit)
+
+        self.received = {}
+        self.bytes_total = 0
+        self.bytes_sampled = 0
+        self.last_throughput = None
+
+        self.sample_timer = QTimer(self)
+        self.sample_timer.setInterval(G.DOWNLOAD_SAMPLE_INTERVAL)
+        self.sample_timer.timeout.connect(self.adapt)
+        self.sample_timer.start()
+
+    def enqueue(self, book, priority=0):
+        book.book_lists.append(self.queue)
+        self.queue.append(book, priority)
+        self.process()
+
+    def process(self):
+        if not self.running:
+            return
+        self.prune()
+        while len(self.active) < self.limit and self.queue:
+            book = self.queue.popleft()
+            book.download_engine = self.pool.acquire()
+            book.download_attempts += 1
+            self.active[id(book)] = book
+            self.start_download(book)
+            QTimer.singleShot(
+                G.DOWNLOAD_TIMEOUT,
+                lambda b=book, a=book.download_attempts: self.checkTimeout(b, a),
+            )
+
+    def prune(self):
+        for book in [
+            b for b in self.active.values() if not G.books.hasBook(b)
+        ]:
+            self.active.pop(id(book))
+            self.received.pop(id(book), None)
+            if book.download_engine is not None:
+                self.pool.release(book.download_engine)
+                book.download_engine = None
+
+    def checkTimeout(self, book, attempt):
+        if id(book) in self.active and book.download is None:
+            if book.download_attempts == attempt:
+                self.fail(book)
+
+    def progress(self, book, received, total):
+        previous = self.received.get(id(book), 0)
+        self.received[id(book)] = received
+        self.bytes_total += max(0, received - previous)
+
+    def releaseBook(self, book):
+        self.active.pop(id(book), None)
+        self.received.pop(id(book), None)
+        if book.download_engine is not None:
+            self.pool.release(book.download_engine)
+            book.download_engine = None
+
+    def complete(self, book):
+        self.releaseBook(book)
+        self.process()
+
+    def detach(self, book):
+        self.releaseBook(book)
+        self.process()
+
+    def fail(self, book):
+        self.releaseBook(book)
+        if book.download is not None:
+            book.download.cancel()
+            book.download = None
+
+        if book.download_attempts > G.DOWNLOAD_RETRIES:
+            book.list_item.progress_bar.config(value=0, text="Failed")
+            self.process()
+            return
+
+        delay = G.DOWNLOAD_RETRY_DELAY * 2 ** (book.download_attempts - 1)
+        book.list_item.progress_bar.config(
+            value=0, text=f"Retrying In {delay // 1000}s"
+        )
+        QTimer.singleShot(delay, lambda: self.retry(book))
+        self.process()
+
+    def retry(self, book):
+        if not G.books.hasBook(book) or not self.running:
+            return
+        book.list_item.progress_bar.config(text="Queued")
+        self.queue.append(book, 1)
+        self.process()
+
+    def engineMemory(self):
+        pids = {
+            engine.page().renderProcessPid() for engine in self.pool.engines()
+        }
+        pids.discard(0)
+        if not pids:
+            return len(self.pool) * G.DOWNLOAD_ENGINE_MEMORY
+
+        memory = 0
+        for pid in pids:
+            try:
+                memory += psutil.Process(pid).memory_info().rss
+            except psutil.Error:
+                memory += G.DOWNLOAD_ENGINE_MEMORY * 2**20
+        return memory // 2**20
+
+    def adapt(self):
+        interval = G.DOWNLOAD_SAMPLE_INTERVAL / 1000
+        throughput = (self.bytes_total - self.bytes_sampled) / interval
+        self.bytes_sampled = self.bytes_total
+        min_limit, max_limit = G.DOWNLOAD_LIMITS
+
+        if self.engineMemory() > G.DOWNLOAD_MEMORY_BUDGET:
+            self.limit = max(min_limit, self.limit - 1)
+        elif self.queue and len(self.active) >= self.limit:
+            if self.last_throughput is None or throughput > self.last_throughput * 1.1:
+                self.limit = min(max_limit, self.limit + 1)
+            elif throughput < self.last_throughput * 0.9:
+                self.limit = max(min_limit, self.limit - 1)
+
+        self.last_throughput = throughput
+        self.pool.trim(self.limit)
+        self.process()
+
+    def shutdown(self):
+        self.running = False
+        self.sample_timer.stop()
+        self.queue.clear()
+        self.active = {}
+        self.pool.clear()
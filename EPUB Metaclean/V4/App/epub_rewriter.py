@@ -0,0 +1,236 @@
+import os
+import re
+import copy
+import struct
+import zipfile
+import tempfile
+import posixpath
+import xml.etree.ElementTree as ET
+from html import escape
+from urllib.parse import unquote
+
+
+class EpubRewriter:
+    CONTAINER_PATH = "META-INF/container.xml"
+    TEXT_TYPES = ("application/xhtml+xml", "text/html")
+    LOCAL_HEADER_SIZE = 30
+    DATA_DESCRIPTOR_FLAG = 0x08
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.replacements = {}
+        self.text_filters = []
+        self.manifest = {}
+
+        with zipfile.ZipFile(self.file_path) as archive:
+            self.opf_path = self.findOpfPath(archive)
+            self.opf = archive.read(self.opf_path).decode("utf-8")
+
+        self.opf_original = self.opf
+        self.readManifest()
+
+    def findOpfPath(self, archive):
+        container = ET.fromstring(archive.read(self.CONTAINER_PATH))
+        for element in container.iter():
+            if element.tag.endswith("rootfile"):
+                return element.get("full-path")
+
+        raise ValueError("No OPF rootfile found in container.xml")
+
+    def readManifest(self):
+        opf_dir = posixpath.dirname(self.opf_path)
+        for element in ET.fromstring(self.opf_original).iter():
+            if not element.tag.endswith("item") or element.get("href") is None:
+                continue
+
+            self.manifest[element.get("id")] = (
+                posixpath.normpath(
+                    posixpath.join(opf_dir, unquote(element.get("href")))
+                ),
+                element.get("media-type"),
+            )
+
+    def getPath(self, item_id):
+        if item_id in self.manifest:
+            return self.manifest[item_id][0]
+        return None
+
+    def getTexts(self):
+        return [
+            path
+            for path, media_type in self.manifest.values()
+            if media_type in self.TEXT_TYPES
+        ]
+
+    def readFile(self, item_id):
+        with zipfile.ZipFile(self.file_path) as archive:
+            return archive.read(self.getPath(item_id) or item_id)
+
+    def writeFile(self, item_id, data):
+        self.replacements[self.getPath(item_id) or item_id] = data
+
+    def addTextFilter(self, text_filter):
+        self.text_filters.append(text_filter)
+
+    def setMetadata(self, title=None, author=None, series=None, series_index=None):
+        opf = self.opf
+
+        if title is not None:
+            opf = self.setElement(opf, "dc:title", title)
+
+        if author is not None:
+            opf = self.removeCreators(opf)
+            for name in [a.strip() for a in author.split(",") if a.strip()]:
+                opf = self.insertMetadata(
+                    opf, f"<dc:creator>{escape(name)}</dc:creator>"
+                )
+
+        opf = self.setCalibreMeta(opf, "calibre:series", series)
+        opf = self.setCalibreMeta(
+            opf, "calibre:series_index", series_index if series else None
+        )
+
+        self.opf = opf
+
+    def setElement(self, opf, tag, value):
+        pattern = re.compile(
+            rf"(<{tag}\b[^>]*>).*?(</{tag}>)", re.DOTALL | re.IGNORECASE
+        )
+        if pattern.search(opf):
+            return pattern.sub(
+                lambda m: m.group(1) + escape(str(value)) + m.group(2),
+                opf,
+                count=1,
+            )
+        return self.insertMetadata(opf, f"<{tag}>{escape(str(value))}</{tag}>")
+
+    def removeCreators(self, opf):
+        creator_pattern = re.compile(
+            r"\s*<dc:creator\b([^>]*)>.*?</dc:creator>", re.DOTALL
+        )
+        for attributes in creator_pattern.findall(opf):
+            creator_id = re.search(r'\bid="([^"]+)"', attributes)
+            if creator_id:
+                opf = re.sub(
+                    rf'\s*<meta\b[^>]*refines="#{re.escape(creator_id.group(1))}"[^>]*>.*?</meta>',
+                    "",
+                    opf,
+                    flags=re.DOTALL,
+                )
+        return creator_pattern.sub("", opf)
+
+    def setCalibreMeta(self, opf, name, value):
+        opf = re.sub(rf'\s*<meta\b[^>]*name="{name}"[^>]*/>', "", opf)
+        if value is None:
+            return opf
+        return self.insertMetadata(
+            opf, f'<meta name="{name}" content="{escape(str(value))}"/>'
+        )
+
+    def insertMetadata(self, opf, element):
+        return re.sub(
+            r"(\s*)(</(?:\w+:)?metadata>)",
+            lambda m: f"\n    {element}{m.group(1)}{m.group(2)}",
+            opf,
+            count=1,
+        )
+
+    def save(self, progress=None):
+        replacements = dict(self.replacements)
+        if self.opf != self.opf_original:
+            replacements[self.opf_path] = self.opf.encode("utf-8")
+
+        texts = set(self.getTexts()) if self.text_filters else set()
+        total_texts = len(texts)
+        texts_done = 0
+
+        file_dir = os.path.dirname(os.path.abspath(self.file_path))
+        temp_handle, temp_path = tempfile.mkstemp(
+            prefix=".metaclean-", suffix=".tmp", dir=file_dir
+        )
+        os.close(temp_handle)
+
+        try:
+            with open(self.file_path, "rb") as source_file, zipfile.ZipFile(
+                source_file
+            ) as source, zipfile.ZipFile(temp_path, "w") as target:
+                for info in source.infolist():
+                    data = replacements.get(info.filename)
+
+                    if data is None and info.filename in texts:
+                        data = self.filterText(source.read(info))
+                        texts_done += 1
+                        if progress is not None:
+                            progress(texts_done, total_texts)
+
+                    if data is None:
+                        self.copyRaw(source, source_file, target, info)
+                    else:
+                        self.writeMember(target, info, data)
+
+            os.replace(temp_path, self.file_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self.opf_original = self.opf
+        self.replacements = {}
+
+    def filterText(self, data):
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+        filtered = text
+        for text_filter in self.text_filters:
+            filtered = text_filter(filtered)
+
+        if filtered == text:
+            return None
+        return filtered.encode("utf-8")
+
+    def writeMember(self, target, info, data):
+        new_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+        new_info.compress_type = info.compress_type
+        new_info.external_attr = info.external_attr
+        target.writestr(new_info, data)
+
+    # Copies a member's compressed bytes without re-compressing them. This
+    # writes through ZipFile internals (fp, start_dir, _didModify and
+    # ZipInfo.FileHeader) as laid out in CPython 3.6 to 3.13; when any of
+    # them is missing the member is decompressed and written normally.
+    def canCopyRaw(self, target):
+        return all(
+            hasattr(target, name)
+            for name in ("fp", "start_dir", "_didModify", "filelist")
+        ) and hasattr(zipfile.ZipInfo, "FileHeader")
+
+    def copyRaw(self, source, source_file, target, info):
+        if not self.canCopyRaw(target):
+            self.writeMember(target, info, source.read(info))
+            return
+
+        source_file.seek(info.header_offset)
+        header = source_file.read(self.LOCAL_HEADER_SIZE)
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        source_file.seek(
+            info.header_offset
+            + self.LOCAL_HEADER_SIZE
+            + name_length
+            + extra_length
+        )
+        raw_data = source_file.read(info.compress_size)
+
+        new_info = copy.copy(info)
+        new_info.flag_bits &= ~self.DATA_DESCRIPTOR_FLAG
+        target.fp.seek(target.start_dir)
+        new_info.header_offset = target.fp.tell()
+        target.fp.write(new_info.FileHeader())
+        target.fp.write(raw_data)
+
+        target.filelist.append(new_info)
+        target.NameToInfo[new_info.filename] = new_info
+        target.start_dir = target.fp.tell()
+        target._didModify = True
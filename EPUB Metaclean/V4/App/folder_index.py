@@ -0,0 +1,105 @@
+import os
+from PyQt5.QtCore import (
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    QFileSystemWatcher,
+    pyqtSignal,
+)
+
+
+class FolderScan(QRunnable):
+    def __init__(self, index, generation, known):
+        super().__init__()
+        self.index = index
+        self.generation = generation
+        self.known = known
+
+    def run(self):
+        try:
+            names = {
+                name
+                for name in os.listdir(self.index.path)
+                if self.index.isBook(name)
+            }
+        except OSError as e:
+            print(f"Error scanning folder: {e}")
+            self.index.scanned.emit(self.generation, None, None)
+            return
+
+        added = {
+            name
+            for name in names - self.known
+            if os.path.isfile(os.path.join(self.index.path, name))
+        }
+        removed = self.known - names
+        self.index.scanned.emit(self.generation, added, removed)
+
+
+class FolderIndex(QObject):
+    changed = pyqtSignal()
+    scanned = pyqtSignal(int, object, object)
+
+    def __init__(self, path, extension=".epub", delay=250):
+        super().__init__()
+        self.path = path
+        self.extension = extension
+        self.names = set()
+        self.generation = 0
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.scanned.connect(self.handleScan)
+
+        self.scan_timer = QTimer(self)
+        self.scan_timer.setSingleShot(True)
+        self.scan_timer.setInterval(delay)
+        self.scan_timer.timeout.connect(self.scan)
+
+        self.watcher = QFileSystemWatcher([path], self)
+        self.watcher.directoryChanged.connect(self.rescan)
+        self.scan()
+
+    def __len__(self):
+        return len(self.names)
+
+    def __bool__(self):
+        return bool(self.names)
+
+    def __contains__(self, file_path):
+        return os.path.basename(file_path) in self.names
+
+    def isBook(self, name):
+        return not name.startswith(".") and name.lower().endswith(
+            self.extension
+        )
+
+    def paths(self):
+        return [os.path.join(self.path, name) for name in sorted(self.names)]
+
+    def rescan(self, path=None):
+        if self.path not in self.watcher.directories():
+            self.watcher.addPath(self.path)
+        self.scan_timer.start()
+
+    def scan(self):
+        self.generation += 1
+        self.pool.start(
+            FolderScan(self, self.generation, frozenset(self.names))
+        )
+
+    def handleScan(self, generation, added, removed):
+        if generation != self.generation or added is None:
+            return
+
+        if added or removed:
+            self.names |= added
+            self.names -= removed
+            self.changed.emit()
+
+    def close(self):
+        self.scan_timer.stop()
+        self.watcher.removePaths(self.watcher.directories())
+        self.pool.clear()
+        self.generation += 1
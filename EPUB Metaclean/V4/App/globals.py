@@ -1,5 +1,7 @@
 from PyQt5.QtWidgets import QSizePolicy
+from book_registry import BookRegistry
 import os
+import re
 
 
 class Globals:
@@ -13,12 +15,48 @@ class Globals:
         self.THUMBNAIL_SIZE = 80, 128
         self.OCEANOFPDF_URL = "https://oceanofpdf.com/"
         self.STRING_TO_REMOVE = "OceanofPDF.com"
+        self.CONTENT_FILTERS = [
+            (re.escape(self.STRING_TO_REMOVE), "", "OceanofPDF Watermark"),
+        ]
+        self.MAX_CLEAN_WORKERS = os.cpu_count() or 1
         self.GOODREADS_URL = "https://www.goodreads.com/"
         self.IMAGE_PROVIDER_URL = "https://www.google.com/search?tbm=isch&q="
         self.PLAY_BOOKS = "https://play.google.com/books"
         self.DOWNLOAD_LOCATION = os.path.join(
             os.path.expanduser("~"), "Desktop", "Books"
         )
+        self.DOWNLOAD_START_LIMIT = 3
+        self.DOWNLOAD_LIMITS = 1, 8
+        self.DOWNLOAD_SAMPLE_INTERVAL = 5000
+        self.DOWNLOAD_TIMEOUT = 60000
+        self.DOWNLOAD_RETRIES = 3
+        self.DOWNLOAD_RETRY_DELAY = 2000
+        self.DOWNLOAD_ENGINE_MEMORY = 150
+        self.DOWNLOAD_MEMORY_BUDGET = 2048
+        self.HTTP_DOWNLOAD_THREADS = 4
+        self.APP_DATA_LOCATION = os.path.join(
+            os.path.expanduser("~"), ".metaclean"
+        )
+        self.INDEX_FILE = os.path.join(self.APP_DATA_LOCATION, "index.db")
+        self.GOODREADS_FIXTURES = os.environ.get("METACLEAN_GOODREADS_FIXTURES")
+        self.GOODREADS_CACHE_FILE = self.GOODREADS_FIXTURES or os.path.join(
+            self.APP_DATA_LOCATION, "goodreads.db"
+        )
+        self.GOODREADS_CACHE_TTL = 30 * 24 * 60 * 60
+        self.GOODREADS_CACHE_MAX_BYTES = 200 * 1024 * 1024
+        self.GOODREADS_PREFETCH_DEPTH = 3
+        self.GOODREADS_MATCH_CANDIDATES = 3
+        self.GOODREADS_AUTO_MATCH = False
+        self.GOODREADS_MATCH_THRESHOLD = 0.9
+        self.GOODREADS_MATCH_MARGIN = 0.1
+        self.COVER_STORE_LOCATION = os.path.join(
+            self.APP_DATA_LOCATION, "covers"
+        )
+        self.UPLOAD_JOURNAL_FILE = os.path.join(
+            self.APP_DATA_LOCATION, "uploads.json"
+        )
+        self.UPLOAD_BATCH_BYTES = 200 * 1024 * 1024
+        self.UPLOAD_BATCH_FILES = 20
 
         self.PREFERRED = QSizePolicy.Preferred
         self.EXPANDING = QSizePolicy.Expanding
@@ -46,14 +84,16 @@ class Globals:
         self.download_worker = None
         self.process_worker = None
         self.upload_worker = None
+        self.book_index = None
+        self.goodreads_cache = None
+        self.download_folder = None
+        self.cover_store = None
 
-        self.books = []
+        self.books = BookRegistry()
 
     def addBook(self, book):
         book.book_lists.append(self.books)
-        self.books.append(book)
-        self.books.sort(key=lambda b: b.title.lower() if b.title else "")
-        return self.books.index(book)
+        return self.books.add(book)
 
     def setDeleteBtns(self, action=None):
         for book in self.books:
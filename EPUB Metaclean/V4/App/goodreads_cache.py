@@ -0,0 +1,122 @@
+import json
+import time
+import sqlite3
+import threading
+import requests
+
+
+class GoodreadsCache:
+    def __init__(self, db_path, ttl, max_bytes, offline=False, headers=None):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.lock = threading.Lock()
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+
+        self.connection = sqlite3.connect(
+            self.db_path, check_same_thread=False
+        )
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                data BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL,
+                PRIMARY KEY (kind, key)
+            )
+            """
+        )
+        self.connection.commit()
+
+    def get(self, kind, key):
+        if key is None:
+            return None
+
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT data, created FROM responses WHERE kind = ? AND key = ?",
+                (kind, str(key)),
+            ).fetchone()
+            if row is None:
+                return None
+
+            data, created = row
+            if not self.offline and time.time() - created > self.ttl:
+                self.connection.execute(
+                    "DELETE FROM responses WHERE kind = ? AND key = ?",
+                    (kind, str(key)),
+                )
+                self.connection.commit()
+                return None
+
+            self.connection.execute(
+                "UPDATE responses SET accessed = ? WHERE kind = ? AND key = ?",
+                (time.time(), kind, str(key)),
+            )
+            self.connection.commit()
+            return data
+
+    def put(self, kind, key, data):
+        if key is None or self.offline:
+            return
+
+        now = time.time()
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(kind, key, data, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, str(key), data, len(data), now, now),
+            )
+            self.evict()
+            self.connection.commit()
+
+    def getJson(self, kind, key):
+        data = self.get(kind, key)
+        return json.loads(data) if data is not None else None
+
+    def putJson(self, kind, key, value):
+        self.put(kind, key, json.dumps(value).encode("utf-8"))
+
+    def fetch(self, kind, key, url, **kwargs):
+        data = self.get(kind, key if key is not None else url)
+        if data is not None:
+            return data
+
+        if self.offline:
+            raise LookupError(f"No recorded {kind} response for {key or url}")
+
+        response = self.session.get(url, timeout=30, **kwargs)
+        response.raise_for_status()
+        self.put(kind, key if key is not None else url, response.content)
+        return response.content
+
+    def evict(self):
+        total = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = self.max_bytes * 0.9
+        rows = self.connection.execute(
+            "SELECT kind, key, size FROM responses ORDER BY accessed"
+        ).fetchall()
+        for kind, key, size in rows:
+            if total <= target:
+                break
+            self.connection.execute(
+                "DELETE FROM responses WHERE kind = ? AND key = ?", (kind, key)
+            )
+            total -= size
+
+    def close(self):
+        with self.lock:
+            self.connection.commit()
+            self.connection.close()
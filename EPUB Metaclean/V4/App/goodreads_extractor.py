@@ -0,0 +1,149 @@
+import re
+import json
+from html import unescape
+
+LINKED_DATA_PATTERN = re.compile(
+    r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>', re.DOTALL
+)
+NEXT_DATA_PATTERN = re.compile(
+    r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL
+)
+SERIES_LINK_PATTERN = re.compile(
+    r'<a[^>]*href="https://www\.goodreads\.com/series[^"]*"[^>]*>(.*?)</a>',
+    re.DOTALL,
+)
+TITLE_SERIES_PATTERN = re.compile(r"\s*\(([^()]+?),?\s*#([\d.]+)\)\s*$")
+TAG_PATTERN = re.compile(r"<[^>]+>")
+SEARCH_RESULT_PATTERN = re.compile(r'href="(/book/show/(\d+)[^"?]*)')
+
+
+def emptyData():
+    return {
+        "title": None,
+        "author": None,
+        "series": None,
+        "series_index": None,
+        "cover_url": None,
+    }
+
+
+def extractGoodreadsData(html):
+    if isinstance(html, bytes):
+        html = html.decode("utf-8", errors="ignore")
+
+    data = emptyData()
+    readLinkedData(html, data)
+    readNextData(html, data)
+
+    if data["series"] is None:
+        readSeriesLink(html, data)
+
+    if (
+        data["title"] is None
+        or data["author"] is None
+        or data["cover_url"] is None
+    ):
+        readWithSoup(html, data)
+
+    return data
+
+
+def readSearchResults(html):
+    if isinstance(html, bytes):
+        html = html.decode("utf-8", errors="ignore")
+
+    results = []
+    for path, goodreads_id in SEARCH_RESULT_PATTERN.findall(html):
+        if goodreads_id not in (r[0] for r in results):
+            results.append((goodreads_id, path.lstrip("/")))
+    return results
+
+
+def splitSeries(title, data):
+    match = TITLE_SERIES_PATTERN.search(title)
+    if not match:
+        return title
+
+    if data["series"] is None:
+        data["series"] = match.group(1).strip()
+        data["series_index"] = match.group(2)
+    return title[: match.start()].strip()
+
+
+def readLinkedData(html, data):
+    for block in LINKED_DATA_PATTERN.findall(html):
+        try:
+            linked_data = json.loads(block)
+        except ValueError:
+            continue
+
+        if not isinstance(linked_data, dict) or linked_data.get("@type") != "Book":
+            continue
+
+        if linked_data.get("name"):
+            data["title"] = splitSeries(unescape(linked_data["name"]), data)
+
+        authors = linked_data.get("author")
+        if isinstance(authors, dict):
+            authors = [authors]
+        if authors and authors[0].get("name"):
+            data["author"] = unescape(authors[0]["name"])
+
+        if linked_data.get("image"):
+            data["cover_url"] = linked_data["image"]
+        return
+
+
+def readNextData(html, data):
+    match = NEXT_DATA_PATTERN.search(html)
+    if not match:
+        return
+
+    try:
+        state = json.loads(match.group(1))["props"]["pageProps"]["apolloState"]
+    except (ValueError, KeyError, TypeError):
+        return
+
+    for item in state.values():
+        if not isinstance(item, dict) or item.get("__typename") != "Book":
+            continue
+        if not item.get("bookSeries"):
+            continue
+        if data["cover_url"] is not None and item.get("imageUrl") != data[
+            "cover_url"
+        ]:
+            continue
+
+        book_series = item["bookSeries"][0]
+        series = state.get(book_series.get("series", {}).get("__ref"), {})
+        if series.get("title"):
+            data["series"] = unescape(series["title"])
+            data["series_index"] = book_series.get("userPosition") or None
+        return
+
+
+def readSeriesLink(html, data):
+    match = SERIES_LINK_PATTERN.search(html)
+    if not match:
+        return
+
+    series_text = unescape(TAG_PATTERN.sub("", match.group(1))).split("#")
+    data["series"] = series_text[0].strip()
+    if len(series_text) > 1:
+        data["series_index"] = series_text[1].strip()
+
+
+def readWithSoup(html, data):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.select_one(".Text__title1")
+    author = soup.select_one(".ContributorLink__name")
+    cover = soup.select_one(".BookCover__image img")
+
+    if data["title"] is None and title is not None:
+        data["title"] = title.text.strip()
+    if data["author"] is None and author is not None:
+        data["author"] = author.text.strip()
+    if data["cover_url"] is None and cover is not None:
+        data["cover_url"] = cover["src"]
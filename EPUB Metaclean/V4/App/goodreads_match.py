@@ -0,0 +1,52 @@
+import re
+from difflib import SequenceMatcher
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+STOP_WORDS = {"a", "an", "the", "and", "of", "by"}
+MATCH_WEIGHTS = {"title": 0.6, "author": 0.3, "series": 0.1}
+
+
+def normalise(text):
+    if not text:
+        return ""
+    words = WORD_PATTERN.findall(str(text).lower())
+    return " ".join(sorted(w for w in words if w not in STOP_WORDS))
+
+
+def similarity(first, second):
+    first = normalise(first)
+    second = normalise(second)
+    if not first or not second:
+        return 0.0
+    if first == second:
+        return 1.0
+    return SequenceMatcher(None, first, second).ratio()
+
+
+def bookQuery(book):
+    return {
+        "title": book.title,
+        "author": book.author,
+        "series": book.series,
+    }
+
+
+def scoreMatch(query, data):
+    score = 0.0
+    weight = 0.0
+    for field, field_weight in MATCH_WEIGHTS.items():
+        if not query.get(field):
+            continue
+        score += similarity(query[field], data.get(field)) * field_weight
+        weight += field_weight
+    return score / weight if weight else 0.0
+
+
+def rankMatches(candidates, threshold, margin):
+    candidates.sort(key=lambda c: c["score"], reverse=True)
+    best = candidates[0]
+    runner_up = candidates[1]["score"] if len(candidates) > 1 else 0.0
+    best["confident"] = (
+        best["score"] >= threshold and best["score"] - runner_up >= margin
+    )
+    return best
@@ -0,0 +1,114 @@
+from urllib.parse import quote_plus
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from goodreads_extractor import extractGoodreadsData, readSearchResults
+from goodreads_match import bookQuery, scoreMatch, rankMatches
+from globals import G
+
+
+def searchUrl(book):
+    query = " ".join(part for part in (book.title, book.author) if part)
+    return G.GOODREADS_URL + "search?q=" + quote_plus(query)
+
+
+class GoodreadsPrefetchTask(QRunnable):
+    def __init__(self, prefetcher, book, generation):
+        super().__init__()
+        self.prefetcher = prefetcher
+        self.book = book
+        self.url = searchUrl(book)
+        self.query = bookQuery(book)
+        self.fetch_cover = book.cover_id is not None
+        self.generation = generation
+
+    def run(self):
+        try:
+            match = self.fetch()
+        except Exception as e:
+            print(f"Error prefetching Goodreads data: {e}")
+            match = None
+        self.prefetcher.taskDone.emit(self.book, match, self.generation)
+
+    def fetch(self):
+        search = G.goodreads_cache.fetch("search", self.url, self.url)
+        results = readSearchResults(search)[: G.GOODREADS_MATCH_CANDIDATES]
+        if not results:
+            return None
+
+        candidates = []
+        for goodreads_id, path in results:
+            url = G.GOODREADS_URL + path
+            data = self.readCandidate(goodreads_id, url)
+            candidates.append(
+                {
+                    "id": goodreads_id,
+                    "url": url,
+                    "data": data,
+                    "score": scoreMatch(self.query, data),
+                }
+            )
+
+        match = rankMatches(
+            candidates, G.GOODREADS_MATCH_THRESHOLD, G.GOODREADS_MATCH_MARGIN
+        )
+        if self.fetch_cover and match["data"]["cover_url"] is not None:
+            G.goodreads_cache.fetch(
+                "cover", match["id"], match["data"]["cover_url"]
+            )
+        return match
+
+    def readCandidate(self, goodreads_id, url):
+        data = G.goodreads_cache.getJson("meta", goodreads_id)
+        if data is None:
+            html = G.goodreads_cache.fetch("page", goodreads_id, url)
+            data = extractGoodreadsData(html)
+            G.goodreads_cache.putJson("meta", goodreads_id, data)
+        return data
+
+
+class GoodreadsPrefetcher(QObject):
+    taskDone = pyqtSignal(object, object, int)
+    matchReady = pyqtSignal(object)
+
+    def __init__(self, depth):
+        super().__init__()
+        self.depth = depth
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(depth)
+        self.generation = 0
+        self.pending = set()
+        self.matches = {}
+        self.taskDone.connect(self.handleTaskDone)
+
+    def prefetch(self, books, depth=None):
+        depth = depth if depth is not None else self.depth
+        started = 0
+        for book in books:
+            if started >= depth:
+                return
+            started += 1
+            if id(book) in self.pending or id(book) in self.matches:
+                continue
+            self.pending.add(id(book))
+            self.pool.start(
+                GoodreadsPrefetchTask(self, book, self.generation)
+            )
+
+    def handleTaskDone(self, book, match, generation):
+        if generation != self.generation:
+            return
+
+        self.pending.discard(id(book))
+        self.matches[id(book)] = match
+        self.matchReady.emit(book)
+
+    def match(self, book):
+        return self.matches.get(id(book))
+
+    def forget(self, book):
+        self.matches.pop(id(book), None)
+
+    def cancel(self):
+        self.pool.clear()
+        self.generation += 1
+        self.pending = set()
+        self.matches = {}
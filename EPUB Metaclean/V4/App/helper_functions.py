@@ -24,3 +24,17 @@ def resizeCoverImage(img_data):
     image.save(output, format="JPEG", quality=95)
 
     return output.getvalue()
+
+
+def createThumbnail(img_data, size):
+    image = Image.open(BytesIO(img_data))
+    image.draft("RGB", size)
+    if image.mode in ("RGBA", "P"):
+        image = image.convert("RGB")
+
+    image.thumbnail(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+    output = BytesIO()
+    image.save(output, format="JPEG", quality=85)
+
+    return output.getvalue()
@@ -0,0 +1,127 @@
+import os
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class HttpDownload(QRunnable):
+    def __init__(self, downloader, book, url, file_path):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.downloader = downloader
+        self.book = book
+        self.url = url
+        self.file_path = file_path
+        self.part_path = file_path + downloader.PART_SUFFIX
+        self.cancelled = threading.Event()
+        self.finished = threading.Event()
+
+    def isFinished(self):
+        return self.finished.is_set()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def run(self):
+        try:
+            ok = self.fetch()
+        except requests.HTTPError as e:
+            print(f"Error downloading book: {e}")
+            self.removePart()
+            ok = False
+        except (requests.RequestException, OSError) as e:
+            print(f"Error downloading book: {e}")
+            ok = False
+
+        if self.cancelled.is_set():
+            self.removePart()
+        self.finished.set()
+        self.downloader.taskDone.emit(self.book, ok)
+
+    def fetch(self):
+        received = 0
+        headers = {}
+        if os.path.exists(self.part_path):
+            received = os.path.getsize(self.part_path)
+            headers["Range"] = f"bytes={received}-"
+
+        with self.downloader.session.get(
+            self.url, headers=headers, stream=True, timeout=30
+        ) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                received = 0
+
+            total = int(response.headers.get("Content-Length", 0)) + received
+            with open(self.part_path, "ab" if received else "wb") as output:
+                for chunk in response.iter_content(self.downloader.CHUNK_SIZE):
+                    if self.cancelled.is_set():
+                        return False
+                    output.write(chunk)
+                    received += len(chunk)
+                    self.downloader.taskProgress.emit(
+                        self.book, received, total
+                    )
+
+        os.replace(self.part_path, self.file_path)
+        return True
+
+    def removePart(self):
+        try:
+            os.remove(self.part_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error removing partial download: {e}")
+
+
+class HttpDownloader(QObject):
+    CHUNK_SIZE = 256 * 1024
+    PART_SUFFIX = ".part"
+
+    taskProgress = pyqtSignal(object, int, int)
+    taskDone = pyqtSignal(object, bool)
+
+    def __init__(self, user_agent=None, max_threads=4, cookie_store=None):
+        super().__init__()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max_threads, pool_maxsize=max_threads
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self.downloads = set()
+        self.taskDone.connect(self.forget)
+
+        if cookie_store is not None:
+            cookie_store.cookieAdded.connect(self.addCookie)
+            cookie_store.loadAllCookies()
+
+    def addCookie(self, cookie):
+        self.session.cookies.set(
+            bytes(cookie.name()).decode(errors="ignore"),
+            bytes(cookie.value()).decode(errors="ignore"),
+            domain=cookie.domain(),
+            path=cookie.path() or "/",
+        )
+
+    def download(self, book, url, file_path):
+        task = HttpDownload(self, book, url, file_path)
+        self.downloads.add(task)
+        self.pool.start(task)
+        return task
+
+    def forget(self, book, ok):
+        self.downloads = {d for d in self.downloads if d.book is not book}
+
+    def cancelAll(self):
+        self.pool.clear()
+        for task in self.downloads:
+            task.cancel()
+        self.downloads = set()
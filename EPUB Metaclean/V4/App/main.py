@@ -1,23 +1,40 @@
 import sys
-import epubfile
 import re
+import multiprocessing
 import json
 from globals import G
 from ui import UI
 from book_class import Book
+from batch_cleaner import BatchCleaner
+from book_index import BookIndex
+from book_loader import BookLoader
+from folder_index import FolderIndex
+from cover_store import CoverStore
+from upload_journal import UploadJournal, makeBatches
+from goodreads_cache import GoodreadsCache
+from goodreads_prefetch import GoodreadsPrefetcher, searchUrl
 from helper_functions import *
-from qt_overrides import WebEngineView
+from download_scheduler import DownloadScheduler
+from http_downloader import HttpDownloader
 from PyQt5.QtWidgets import QApplication, QFileDialog
 from PyQt5.QtCore import QTimer, QPoint, QUrl, QMimeData, Qt
 from PyQt5.QtGui import QDrag, QCursor
+from PyQt5.QtWebEngineWidgets import QWebEngineDownloadItem
 
 
 class Downloads:
-    MAX_DOWNLOADS = 3
-
     def __init__(self):
-        self.download_queue = []
-        self.current_download_count = 0
+        self.scheduler = DownloadScheduler(
+            ui.hidden_engines_box, self.startDownload
+        )
+        profile = ui.web_engine.page().profile()
+        self.http = HttpDownloader(
+            profile.httpUserAgent(),
+            G.HTTP_DOWNLOAD_THREADS,
+            profile.cookieStore(),
+        )
+        self.http.taskProgress.connect(self.httpDownloadProgress)
+        self.http.taskDone.connect(self.httpDownloadComplete)
 
         self.setupUI()
         ui.updateUIParts()
@@ -52,12 +69,23 @@ class Downloads:
 
     def cleanUp(self):
         ui.showContent()
+        incomplete_books = [
+            book
+            for book in G.books
+            if book.download_engine is not None
+            or book.file_path is None
+            or (book.download is not None and not book.download.isFinished())
+        ]
+
+        try:
+            self.http.taskProgress.disconnect(self.httpDownloadProgress)
+            self.http.taskDone.disconnect(self.httpDownloadComplete)
+        except TypeError:
+            pass
+        self.scheduler.shutdown()
+        self.http.cancelAll()
         ui.hidden_engines_box.clear()
         ui.web_engine.setInterceptor(None)
-        incomplete_books = []
-        for book in G.books:
-            if book.download_engine is not None or book.file_path is None:
-                incomplete_books.append(book)
 
         for book in incomplete_books:
             book.deleteBook()
@@ -90,13 +118,7 @@ class Downloads:
         return False
 
     def checkBookAlreadyDownloaded(self, url):
-        url = url.split("/")[-2]
-        for book in G.books:
-            if book.oceanofpdf_url is not None:
-                if book.oceanofpdf_url.split("/")[-2] == url:
-                    return True
-
-        return False
+        return G.books.findSlug(url) is not None
 
     def queueDownload(self, url):
         ui.status.setText("EPUB Available, Fetching...")
@@ -115,26 +137,18 @@ class Downloads:
         book.list_item = ui.BookItem(ui, book, insert_index)
         book.list_item.progress_bar.config(text="Queued")
         book.list_item.progress_bar.show()
-        book.book_lists.append(self.download_queue)
-        self.download_queue.append(book)
-        self.processQueue()
-
-    def processQueue(self):
-        while (
-            self.current_download_count < self.MAX_DOWNLOADS
-            and self.download_queue
-        ):
-            book = self.download_queue.pop(0)
-            self.current_download_count += 1
-            self.startDownload(book)
+        self.scheduler.enqueue(book)
 
     def startDownload(self, book):
         book.list_item.progress_bar.config(text="Starting Download")
-        book.download_engine = WebEngineView(ui.hidden_engines_box)
         book.download_engine.downloadReq(self.handleDownload)
-        book.download_engine.loaded(lambda: self.openBookPage(book))
+        book.download_engine.loaded(
+            lambda ok: self.openBookPage(book)
+            if ok
+            else self.scheduler.fail(book)
+        )
         book.download_engine.setUrl(book.oceanofpdf_url)
-        ui.updateUIParts()
+        ui.updateUIParts("nav_btns")
 
     def openBookPage(self, book):
         js_code = """
@@ -162,40 +176,98 @@ class Downloads:
             (b for b in G.books if b.download_engine == download.page().view()),
             None,
         )
+        if book is None:
+            download.cancel()
+            return
         for b in G.books:
             if b.file_name == file_name:
                 ui.status.setText(
                     "Already Downloaded! - Waiting For User Input..."
                 )
                 book.deleteBook(False)
-                self.current_download_count -= 1
                 ui.updateUIParts()
-                self.processQueue()
+                self.scheduler.process()
                 return
-        download.accept()
         book.list_item.progress_bar.config(text="Downloading")
-        book.download = download
         book.file_name = file_name
         book.file_path = file_path
+        G.books.reindex(book)
+
+        if not book.http_failed:
+            download.cancel()
+            book.download = self.http.download(
+                book, download.url().toString(), file_path
+            )
+            self.scheduler.detach(book)
+            ui.updateUIParts("nav_btns")
+            return
+
+        download.accept()
+        book.download = download
         book.download.downloadProgress.connect(
             book.list_item.progress_bar.updateProgress
         )
+        book.download.downloadProgress.connect(
+            lambda received, total: self.scheduler.progress(
+                book, received, total
+            )
+        )
         book.download.finished.connect(lambda: self.downloadComplete(book))
-        ui.updateUIParts()
+        ui.updateUIParts("nav_btns")
+
+    def httpDownloadProgress(self, book, received, total):
+        if book.list_item is not None:
+            book.list_item.progress_bar.updateProgress(received, total)
+        self.scheduler.progress(book, received, total)
+
+    def httpDownloadComplete(self, book, ok):
+        if not self.scheduler.running:
+            return
+        if not G.books.hasBook(book) or book.download is None:
+            return
+
+        if not ok:
+            book.http_failed = True
+            book.file_name = None
+            book.file_path = None
+            G.books.reindex(book)
+            self.scheduler.fail(book)
+            return
+
+        self.finishDownload(book)
 
     def downloadComplete(self, book):
-        if book:
-            book.getFileData(book.file_path)
-            ui.updateUIParts()
-        book.download_engine.delete()
-        book.download_engine = None
-        self.current_download_count -= 1
-        self.processQueue()
+        if book not in G.books or book.download is None:
+            return
+
+        if book.download.state() != QWebEngineDownloadItem.DownloadCompleted:
+            book.file_name = None
+            book.file_path = None
+            G.books.reindex(book)
+            self.scheduler.fail(book)
+            return
+
+        self.finishDownload(book)
+
+    def finishDownload(self, book):
+        book.getFileData(book.file_path)
+        G.books.reindex(book)
+        G.book_index.commit()
+        if book.list_item is not None:
+            book.list_item.updateData()
+        ui.updateUIParts("nav_btns")
+        self.scheduler.complete(book)
 
 
 class Process:
     def __init__(self):
         self.show_select = False
+        self.cleaner = None
+        self.current_book = None
+        self.auto_pending = None
+        self.clean_summary = None
+        self.prefetcher = GoodreadsPrefetcher(G.GOODREADS_PREFETCH_DEPTH)
+        self.prefetcher.matchReady.connect(self.prefetchReady)
         self.setupUI()
         ui.updateUIParts()
         QTimer.singleShot(50, self.cleanBooks)
@@ -221,7 +293,16 @@ class Process:
             )
         )
 
+        ui.back_btn.click(self.goBack)
+
     def cleanUp(self):
+        if self.cleaner is not None:
+            self.cleaner.cancel()
+            self.cleaner = None
+        self.prefetcher.cancel()
+        self.current_book = None
+        self.auto_pending = None
+        ui.back_btn.click(ui.web_engine.back)
         for book in G.books:
             book.list_item.setTheme()
         ui.showContent()
@@ -240,37 +321,89 @@ class Process:
 
     def cleanBooks(self):
         ui.status.setText("Cleaning Books...")
-        for book in G.books:
-            if book is None:
-                continue
-            book_file = epubfile.Epub(book.file_path)
-            book_pages = len(book_file.get_texts())
+        books = {book.file_path: book for book in G.books if book is not None}
+        for book in books.values():
             book.list_item.progress_bar.config(value=0, text="Cleaning Pages")
             book.list_item.progress_bar.show()
 
-            for index, page in enumerate(book_file.get_texts()):
-                soup = book_file.read_file(page)
-                soup = re.sub(G.STRING_TO_REMOVE, "", soup)
-                book_file.write_file(page, soup)
-                book.list_item.progress_bar.updateProgress(
-                    index + 1, book_pages
-                )
+        self.cleaner = BatchCleaner(G.CONTENT_FILTERS, G.MAX_CLEAN_WORKERS)
+        self.cleaner.progress.connect(
+            lambda path, done, total: books[
+                path
+            ].list_item.progress_bar.updateProgress(done, total)
+        )
+        self.cleaner.bookFinished.connect(
+            lambda path, error, hits: self.bookCleaned(books[path], error, hits)
+        )
+        self.cleaner.finished.connect(self.booksCleaned)
+        self.cleaner.start(list(books))
+
+    def bookCleaned(self, book, error, hits):
+        if error:
+            print(f"Error cleaning book: {error}")
+        else:
+            book.cleaned = True
+            book.scrub_hits = hits
+            G.book_index.put(book)
+            G.book_index.commit()
+        book.list_item.progress_bar.hide()
+
+    def booksCleaned(self):
+        if self.cleaner.hits:
+            self.clean_summary = "Removed " + ", ".join(
+                f"{count} x {rule}" for rule, count in self.cleaner.hits.items()
+            )
+            ui.updateUIParts("task_label")
+        self.autoMatchBooks()
+
+    def autoMatchBooks(self):
+        requeued = self.checkRequeue()
+        books = [
+            book
+            for book in G.books
+            if not book.meta_updated and id(book) not in requeued
+        ]
+        if not G.GOODREADS_AUTO_MATCH or not books:
+            self.searchBook()
+            return
 
-            book_file.save(book.file_path)
+        ui.status.setText("Auto Matching Book Metadata...")
+        self.auto_pending = {id(book) for book in books}
+        for book in books:
+            book.list_item.progress_bar.config(value=0, text="Matching")
+            book.list_item.progress_bar.show()
+        self.prefetcher.prefetch(books, len(books))
+
+    def autoMatchDone(self, book):
+        self.auto_pending.discard(id(book))
+        match = self.prefetcher.match(book)
+        if book in G.books:
             book.list_item.progress_bar.hide()
+            if match is not None and match["confident"]:
+                book.getGoodreadsData(
+                    None, goodreads_id=match["id"], data=match["data"]
+                )
+                self.finaliseBook(book)
 
-        self.searchBook()
+        if not self.auto_pending:
+            self.auto_pending = None
+            ui.updateUIParts()
+            self.searchBook()
 
     def searchBook(self):
         ui.status.setText("Searching For Book Metadata...")
         G.setDeleteBtns(self.searchBook)
         ui.web_engine.show()
-        ui.web_engine.loaded(ui.updateUIParts)
+        ui.web_engine.loaded(lambda ok: ui.updateUIParts("nav_btns"))
         ui.nav_btn_1.setText("Select")
         ui.nav_btn_1.click(lambda: ui.web_engine.page().toHtml(self.selectBook))
         self.checkRequeue()
+        self.prefetcher.prefetch(
+            [book for book in G.books if not book.meta_updated]
+        )
         for book in G.books:
             if not book.meta_updated:
+                self.current_book = book
                 ui.nav_btn_2.setText("Skip")
                 ui.nav_btn_2.click(
                     lambda: ui.confirmAction(
@@ -282,25 +415,40 @@ class Process:
                         ),
                         warn_text=True,
                         warn_true=True,
-                        image=book.cover,
+                        image=book.coverHash(),
                     )
                 )
                 ui.web_engine.setInterceptor(self.urlInterceptor)
+                match = self.prefetcher.match(book)
                 QTimer.singleShot(
                     50,
                     lambda: ui.web_engine.setUrl(
-                        G.GOODREADS_URL
-                        + "search?q="
-                        + book.title.replace(" ", "+")
-                        + "+"
-                        + book.author.replace(" ", "+")
+                        match["url"] if match else searchUrl(book)
                     ),
                 )
                 book.list_item.setTheme("highlight")
                 ui.updateUIParts()
                 return
+        self.current_book = None
         QTimer.singleShot(100, self.close)
 
+    def prefetchReady(self, book):
+        if self.auto_pending is not None and id(book) in self.auto_pending:
+            self.autoMatchDone(book)
+            return
+
+        match = self.prefetcher.match(book)
+        if book is not self.current_book or match is None:
+            return
+        if ui.web_engine.url().toString() == searchUrl(book):
+            ui.web_engine.setUrl(match["url"])
+
+    def goBack(self):
+        if ui.web_engine.history().canGoBack():
+            ui.web_engine.back()
+        elif self.current_book is not None:
+            ui.web_engine.setUrl(searchUrl(self.current_book))
+
     def urlInterceptor(self, url):
         url = str(url.toString())
         if not url.startswith(G.GOODREADS_URL):
@@ -316,6 +464,9 @@ class Process:
     def selectBook(self, html):
         ui.status.setText("Scrapping Book Metadata...")
         self.show_select = False
+        goodreads_id = re.search(
+            r"book/show/(\d+)", ui.web_engine.url().toString()
+        )
         for book in G.books:
             if book.meta_updated:
                 continue
@@ -325,13 +476,14 @@ class Process:
                     "Original Cover Image",
                     "Are you happy with this cover image?",
                     self.completeBook,
-                    lambda: self.selectCover(book.goodreads_cover),
-                    image=book.cover,
+                    lambda: self.selectCover(book.goodreads_cover_hash),
+                    image=book.coverHash(),
                 ),
+                goodreads_id.group(1) if goodreads_id else None,
             )
             return
 
-    def selectCover(self, image=None, accept=None):
+    def selectCover(self, cover_hash=None, accept=None):
         ui.status.setText("Confirming Cover Image...")
         for book in G.books:
             if book.meta_updated:
@@ -345,18 +497,20 @@ class Process:
                 ui.confirmAction(
                     "Confirm Cover Image",
                     "Are you happy with this cover image?",
-                    lambda: self.completeBook(image),
+                    lambda: self.completeBook(cover_hash),
                     lambda: self.selectCover(accept=False),
-                    image=image,
+                    image=cover_hash,
                 )
                 return
 
             if accept:
                 ui.web_engine.setContextCall()
-                self.completeBook(image)
+                self.completeBook(cover_hash)
                 return
 
-            ui.web_engine.setContextCall(self.selectCover)
+            ui.web_engine.setContextCall(
+                lambda image: self.selectCover(G.cover_store.put(image))
+            )
             ui.web_engine.setInterceptor()
             ui.web_engine.loadedDone()
             ui.web_engine.setUrl(
@@ -366,56 +520,100 @@ class Process:
                 + book.author.replace(" ", "+")
             )
             ui.nav_btn_1.setText("EPUB Cover")
-            ui.nav_btn_1.click(lambda: self.selectCover(book.cover))
+            ui.nav_btn_1.click(lambda: self.selectCover(book.coverHash()))
             ui.nav_btn_1.setText("Goodreads Cover")
-            ui.nav_btn_1.click(lambda: self.selectCover(book.goodreads_cover))
+            ui.nav_btn_1.click(
+                lambda: self.selectCover(book.goodreads_cover_hash)
+            )
             return
 
-    def completeBook(self, image=None):
+    def completeBook(self, cover_hash=None):
         ui.status.setText("Finalising book...")
         for book in G.books:
             if book.meta_updated:
                 continue
 
-            new_title = book.title if book.title is not None else book.file_name
-            new_author = book.author if book.author is not None else None
-            replacements = [".epub", ":", ";", "(", ")", "-", "_", "!", '"']
-            for replacement in replacements:
-                new_title = new_title.replace(replacement, "")
-                new_author = new_author.replace(replacement, "")
-            new_file_path = new_title + (
-                new_author if new_author is not None else ""
-            )
-            new_file_path = os.path.join(
-                G.DOWNLOAD_LOCATION, new_file_path + ".epub"
-            )
-
-            try:
-                os.rename(book.file_path, new_file_path)
-                book.file_path = new_file_path
-                book.file_name = new_title
-            except Exception as e:
-                print(f"Error renaming file: {e}")
-
-            if image is not None:
-                book.cover = image
-            book.saveCover()
-            book.meta_updated = True
-            book.list_item.setTheme()
+            self.finaliseBook(book, cover_hash)
             break
         ui.updateUIParts()
         self.searchBook()
 
+    def finaliseBook(self, book, cover_hash=None):
+        new_title = book.title if book.title is not None else book.file_name
+        new_author = book.author if book.author is not None else None
+        replacements = [".epub", ":", ";", "(", ")", "-", "_", "!", '"']
+        for replacement in replacements:
+            new_title = new_title.replace(replacement, "")
+            new_author = new_author.replace(replacement, "")
+        new_file_path = new_title + (
+            new_author if new_author is not None else ""
+        )
+        new_file_path = os.path.join(
+            G.DOWNLOAD_LOCATION, new_file_path + ".epub"
+        )
+
+        try:
+            os.rename(book.file_path, new_file_path)
+            if G.book_index is not None:
+                G.book_index.remove(book.file_path)
+            book.file_path = new_file_path
+            book.file_name = new_title
+            G.books.reindex(book)
+        except Exception as e:
+            print(f"Error renaming file: {e}")
+
+        if cover_hash is not None:
+            book.cover_hash = cover_hash
+            book.thumbnail = createThumbnail(book.cover, G.THUMBNAIL_SIZE)
+        book.saveMetadata()
+        book.meta_updated = True
+        book.list_item.setTheme()
+
     def checkRequeue(self):
+        requeued = set()
         for book in G.books:
             if book.requeue:
                 book.requeue = False
                 book.meta_updated = False
+                requeued.add(id(book))
+        return requeued
 
 
 class Upload:
+    PICKER_ID = ":0.contentEl"
+    MESSAGE_PREFIX = "metaclean-upload:"
+    WATCH_SCRIPT = """
+    (function(names, pickerId, prefix) {
+        var pending = new Set(names);
+        var observer = new MutationObserver(check);
+        function check() {
+            var text = document.body ? document.body.innerText : "";
+            pending.forEach(function(name) {
+                if (text.indexOf(name) !== -1) {
+                    pending.delete(name);
+                    console.log(prefix + "file:" + name);
+                }
+            });
+            if (!document.getElementById(pickerId)) {
+                observer.disconnect();
+                console.log(prefix + "done");
+            }
+        }
+        observer.observe(document.documentElement, {
+            childList: true, subtree: true, characterData: true
+        });
+        check();
+    })(%s, %s, %s);
+    """
+
     def __init__(self):
         self.callback = None
+        self.journal = UploadJournal(G.UPLOAD_JOURNAL_FILE)
+        self.batches = []
+        self.batch = []
+        self.batch_count = 0
+        self.delete_sources = None
+        self.upload_names = {}
         self.setupUI()
         ui.confirmAction(
             "Important Note",
@@ -454,6 +652,7 @@ class Upload:
         ui.updateUIParts()
 
     def cleanUp(self):
+        ui.web_engine.web_page.console_callback = None
         for book in G.books:
             book.list_item.setTheme()
         ui.showContent()
@@ -506,8 +705,55 @@ class Upload:
             self.callback()
             self.callback = None
 
-    def startUpload(self, ready=False, position=None):
-        ui.status.setText("Uploading Books...")
+    def startUpload(self):
+        books = [book for book in G.books if book.file_path is not None]
+        for book in [b for b in books if not os.path.isfile(b.file_path)]:
+            print(f"Skipping missing upload file: {book.file_path}")
+            book.list_item.progress_bar.config(value=0, text="File Missing")
+            book.list_item.progress_bar.show()
+        books = [book for book in books if os.path.isfile(book.file_path)]
+        uploaded = [b for b in books if self.journal.isUploaded(b.file_path)]
+        pending = {
+            book.file_path: book for book in books if book not in uploaded
+        }
+        self.batches = [
+            [pending[file_path] for file_path in batch]
+            for batch in makeBatches(
+                list(pending), G.UPLOAD_BATCH_BYTES, G.UPLOAD_BATCH_FILES
+            )
+        ]
+        self.batch_count = len(self.batches)
+
+        for book in pending.values():
+            book.list_item.progress_bar.config(value=0, text="Queued")
+            book.list_item.progress_bar.show()
+
+        if uploaded:
+            for book in uploaded:
+                book.list_item.progress_bar.config(value=100, text="Uploaded")
+                book.list_item.progress_bar.show()
+            self.deleteSource(uploaded, self.nextBatch)
+            return
+
+        self.nextBatch()
+
+    def nextBatch(self):
+        if not self.batches:
+            self.journal.clear()
+            ui.status.setText("Waiting For User Input...")
+            self.close()
+            return
+
+        self.batch = self.batches.pop(0)
+        batch_number = self.batch_count - len(self.batches)
+        ui.status.setText(
+            f"Uploading Batch {batch_number} Of {self.batch_count}..."
+        )
+        for book in self.batch:
+            book.list_item.progress_bar.config(value=0, text="Uploading")
+        self.uploadBatch()
+
+    def uploadBatch(self, ready=False, position=None):
         if not ready:
             js_code = (
                 "var element = Array.from(document.querySelectorAll('span.mdc-button__label')).find("
@@ -518,34 +764,34 @@ class Upload:
                 1000,
                 lambda: ui.web_engine.page().runJavaScript(
                     js_code,
-                    lambda result: self.startUpload(result),
+                    lambda result: self.uploadBatch(result),
                 ),
             )
             return
 
         if position is None:
             js_code = """
-            var iframe = document.getElementById(':0.contentEl');
+            var iframe = document.getElementById(%s);
             if (iframe) {
                 var rect = iframe.getBoundingClientRect();
                 JSON.stringify({x: rect.x + rect.width / 2, y: rect.y + rect.height / 2});
             } else {
                 JSON.stringify(null);
             }
-            """
+            """ % json.dumps(self.PICKER_ID)
             ui.web_engine.page().runJavaScript(
-                js_code, lambda result: self.startUpload(True, result)
+                js_code, lambda result: self.uploadBatch(True, result)
             )
             return
 
         if position == "null":
-            QTimer.singleShot(100, lambda: self.startUpload())
+            QTimer.singleShot(100, lambda: self.uploadBatch())
             return
 
         pos_data = json.loads(position)
         x, y = int(pos_data["x"]), int(pos_data["y"])
         view_pos = ui.web_engine.mapToGlobal(QPoint(x, y))
-        file_paths = [QUrl.fromLocalFile(book.file_path) for book in G.books]
+        file_paths = [QUrl.fromLocalFile(book.file_path) for book in self.batch]
         mime_data = QMimeData()
         mime_data.setUrls(file_paths)
         drag = QDrag(ui.web_engine)
@@ -560,31 +806,67 @@ class Upload:
             ),
         )
 
-    def waitForUpload(self, upload_in_progress=True):
-        if upload_in_progress:
-            js_code = """
-            var element = document.getElementById(':0.contentE1');
-            if (element) {true;} else {false;}
-            """
-            ui.web_engine.page().runJavaScript(
-                js_code,
-                lambda result: QTimer.singleShot(
-                    1000, lambda: self.waitForUpload(result)
-                ),
+    def waitForUpload(self):
+        self.upload_names = {
+            os.path.splitext(os.path.basename(book.file_path))[0]: book
+            for book in self.batch
+        }
+        ui.web_engine.web_page.console_callback = self.uploadMessage
+        ui.web_engine.page().runJavaScript(
+            self.WATCH_SCRIPT
+            % (
+                json.dumps(list(self.upload_names)),
+                json.dumps(self.PICKER_ID),
+                json.dumps(self.MESSAGE_PREFIX),
             )
-            return
+        )
 
-        if not upload_in_progress:
-            self.deleteSource()
+    def uploadMessage(self, message):
+        if not message.startswith(self.MESSAGE_PREFIX):
+            return
 
-    def deleteSource(self):
-        ui.status.setText("Deleting Source Files...")
-        G.setDeleteBtns(self.deleteSource)
-        if G.books != []:
-            QTimer.singleShot(100, G.books[0].list_item.deleteBook)
+        message = message[len(self.MESSAGE_PREFIX) :]
+        if message.startswith("file:"):
+            book = self.upload_names.pop(message[len("file:") :], None)
+            if book is not None:
+                self.fileUploaded(book)
+        elif message == "done":
+            ui.web_engine.web_page.console_callback = None
+            self.batchUploaded()
+
+    def fileUploaded(self, book):
+        self.journal.markUploaded([book.file_path])
+        book.list_item.progress_bar.config(value=100, text="Uploaded")
+
+    def batchUploaded(self):
+        for book in self.upload_names.values():
+            self.fileUploaded(book)
+        self.upload_names = {}
+        self.deleteSource(self.batch, self.nextBatch)
+
+    def deleteSource(self, books, finished_action):
+        if self.delete_sources is None:
+            ui.confirmAction(
+                "Deleting Source Files",
+                "Would you like to delete the uploaded source files?",
+                lambda: self.setDeleteSources(True, books, finished_action),
+                lambda: self.setDeleteSources(False, books, finished_action),
+                warn_text=True,
+                warn_true=True,
+            )
             return
-        ui.status.setText("Waiting For User Input...")
-        self.close()
+
+        ui.status.setText("Removing Uploaded Books...")
+        G.setDeleteBtns()
+        for book in books:
+            book.deleteBook(self.delete_sources, commit=False)
+        G.book_index.commit()
+        ui.updateUIParts()
+        QTimer.singleShot(0, finished_action)
+
+    def setDeleteSources(self, delete_sources, books, finished_action):
+        self.delete_sources = delete_sources
+        self.deleteSource(books, finished_action)
 
 
 def close():
@@ -596,12 +878,7 @@ def close():
 
 
 def getSourceFiles():
-    files = [
-        os.path.join(G.DOWNLOAD_LOCATION, f)
-        for f in os.listdir(G.DOWNLOAD_LOCATION)
-        if f.endswith(".epub")
-    ]
-    collectFiles(files)
+    collectFiles(G.download_folder.paths())
 
 
 def getUserFiles():
@@ -612,21 +889,29 @@ def getUserFiles():
 
 
 def collectFiles(files):
-    for file in files:
-        book = Book(file)
-        if not book.is_epub:
-            continue
-        book.download = False
-        if book not in G.books:
-            insert_index = G.addBook(book)
-            book.list_item = ui.BookItem(ui, book, insert_index)
+    book_loader.load(files)
+
 
+def addLoadedBook(book):
+    if not book.is_epub:
+        return
+    book.download = False
+    if book not in G.books:
+        insert_index = G.addBook(book)
+        book.list_item = ui.BookItem(ui, book, insert_index)
+        if len(G.books) == 1:
+            ui.updateUIParts()
+
+
+def booksLoaded():
+    G.book_index.commit()
     ui.updateUIParts()
 
 
 def clearAllFiles():
-    G.books = []
-    ui.book_list_box.container.clear()
+    book_loader.cancel()
+    G.books.clear()
+    ui.book_list_model.clear()
 
 
 def startDownloadBooks():
@@ -645,6 +930,7 @@ def startUploadBooks():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     ui = UI()
 
@@ -654,6 +940,41 @@ if __name__ == "__main__":
 
     if not os.path.exists(G.DOWNLOAD_LOCATION):
         os.makedirs(G.DOWNLOAD_LOCATION)
+    os.makedirs(G.APP_DATA_LOCATION, exist_ok=True)
+
+    G.download_folder = FolderIndex(G.DOWNLOAD_LOCATION)
+    G.download_folder.changed.connect(
+        lambda: ui.updateUIParts("select_downloads")
+    )
+    app.aboutToQuit.connect(G.download_folder.close)
+
+    G.cover_store = CoverStore(G.COVER_STORE_LOCATION)
+    app.aboutToQuit.connect(
+        lambda: G.cover_store.close(
+            {
+                cover_hash
+                for book in G.books
+                for cover_hash in (book.cover_hash, book.goodreads_cover_hash)
+                if cover_hash is not None
+            }
+        )
+    )
+
+    G.book_index = BookIndex(G.INDEX_FILE)
+    app.aboutToQuit.connect(G.book_index.close)
+
+    G.goodreads_cache = GoodreadsCache(
+        G.GOODREADS_CACHE_FILE,
+        G.GOODREADS_CACHE_TTL,
+        G.GOODREADS_CACHE_MAX_BYTES,
+        offline=G.GOODREADS_FIXTURES is not None,
+    )
+    app.aboutToQuit.connect(G.goodreads_cache.close)
+
+    book_loader = BookLoader()
+    book_loader.bookLoaded.connect(addLoadedBook)
+    book_loader.finished.connect(booksLoaded)
+    app.aboutToQuit.connect(book_loader.cancel)
 
     ui.download_task_btn.click(startDownloadBooks)
     ui.process_task_btn.click(startProcessBooks)
@@ -3,11 +3,9 @@ from PyQt5.QtWidgets import (
     QFrame,
     QVBoxLayout,
     QHBoxLayout,
-    QScrollArea,
+    QListView,
     QLabel,
     QPushButton,
-    QGraphicsOpacityEffect,
-    QProgressBar,
     QMenu,
     QAction,
     QApplication,
@@ -17,7 +15,6 @@ from PyQt5.QtCore import (
     QRectF,
     QByteArray,
     QTimer,
-    QSize,
     QBuffer,
     QIODevice,
     QUrl,
@@ -27,9 +24,75 @@ from PyQt5.QtWebEngineWidgets import (
     QWebEnginePage,
     QWebEngineContextMenuData,
 )
-from PyQt5.QtGui import QPainterPath, QBitmap, QPainter, QPixmap, QIcon
+from PyQt5.QtGui import QPainterPath, QBitmap, QPainter, QPixmap
+import hashlib
+from collections import OrderedDict
 from globals import G
-from helper_functions import resizeCoverImage
+
+
+class ImageCache:
+    def __init__(self, max_bytes=32 * 1024 * 1024, max_masks=64):
+        self.max_bytes = max_bytes
+        self.max_masks = max_masks
+        self.pixmap_bytes = 0
+        self.pixmaps = OrderedDict()
+        self.masks = OrderedDict()
+
+    def lookup(self, cache, key):
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    def store(self, cache, key, value, max_items):
+        cache[key] = value
+        if len(cache) > max_items:
+            cache.popitem(last=False)
+        return value
+
+    def pixmap(self, image, size):
+        if not image:
+            return None
+
+        key = (hashlib.sha1(image).digest(), size.width(), size.height())
+        pixmap = self.lookup(self.pixmaps, key)
+        if pixmap is not None:
+            return pixmap
+
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(QByteArray(image)):
+            return None
+        pixmap = pixmap.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+        self.pixmaps[key] = pixmap
+        self.pixmap_bytes += self.pixmapBytes(pixmap)
+        while self.pixmap_bytes > self.max_bytes and len(self.pixmaps) > 1:
+            _, evicted = self.pixmaps.popitem(last=False)
+            self.pixmap_bytes -= self.pixmapBytes(evicted)
+        return pixmap
+
+    def pixmapBytes(self, pixmap):
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def mask(self, size, radius):
+        key = (size.width(), size.height(), radius)
+        mask = self.lookup(self.masks, key)
+        if mask is not None:
+            return mask
+
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(0, 0, size.width(), size.height()), radius, radius)
+        mask = QBitmap(size)
+        mask.fill(Qt.white)
+        painter = QPainter(mask)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(Qt.black)
+        painter.drawPath(path)
+        painter.end()
+        return self.store(self.masks, key, mask, self.max_masks)
+
+
+IMAGE_CACHE = ImageCache()
 
 
 class BaseWidget:
@@ -62,7 +125,11 @@ class BaseWidget:
                 parent.insert(insert_index, self)
 
     def setTheme(self, theme=None):
+        if self.property("theme") == theme:
+            return
         self.setProperty("theme", theme)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
     def hide(self):
         self.setVisible(False)
@@ -76,17 +143,7 @@ class BaseWidget:
 
     def applyBorderRadius(self):
         radius = int(G.STYLE_VARIABLES["border_radius"].replace("px", ""))
-        path = QPainterPath()
-        rect = QRectF(self.rect())
-        path.addRoundedRect(rect, radius, radius)
-        mask = QBitmap(self.size())
-        mask.fill(Qt.white)
-        painter = QPainter(mask)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setBrush(Qt.black)
-        painter.drawPath(path)
-        painter.end()
-        self.setMask(mask)
+        self.setMask(IMAGE_CACHE.mask(self.size(), radius))
 
 
 class Container(QFrame, BaseWidget):
@@ -132,27 +189,25 @@ class Container(QFrame, BaseWidget):
 
     def clear(self):
         for child in self.findChildren(QWidget):
-            if child.objectName() == "book_list_spacer":
-                continue
             child.setParent(None)
             child.deleteLater()
 
 
-class ScrollContainer(QScrollArea, BaseWidget):
+class ListView(QListView, BaseWidget):
     def __init__(
         self,
         parent=None,
         name=None,
-        vertical=True,
         hor_policy=None,
         ver_policy=None,
     ):
-        QScrollArea.__init__(self, parent)
-        BaseWidget.__init__(self, parent, hor_policy, ver_policy)
-
-        self.container = Container(self, name, vertical, hor_policy, ver_policy)
-        self.setWidget(self.container)
-        self.setWidgetResizable(True)
+        QListView.__init__(self, parent)
+        BaseWidget.__init__(self, parent, name, hor_policy, ver_policy)
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setSelectionMode(QListView.NoSelection)
+        self.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
 
 class Label(QLabel, BaseWidget):
@@ -183,10 +238,13 @@ class ImageLabel(QLabel, BaseWidget):
         self.applyBorderRadius()
 
     def setImage(self, image=None):
-        if image is not None:
-            byte_array = QByteArray(image)
+        pixmap = image
+        if not isinstance(image, QPixmap):
             pixmap = QPixmap()
-            pixmap.loadFromData(byte_array)
+            if image:
+                pixmap.loadFromData(QByteArray(image))
+
+        if not pixmap.isNull():
             self.image_original = pixmap
             QTimer.singleShot(0, lambda: self.updateImageSize())
             return True
@@ -224,98 +282,11 @@ class PushButton(QPushButton, BaseWidget):
             pass
 
 
-class ImageButton(QPushButton, BaseWidget):
-    def __init__(self, parent=None, name=None, hor_policy=None, ver_policy=None):
-        QPushButton.__init__(self, "", parent)
-        BaseWidget.__init__(self, parent, name, hor_policy, ver_policy)
-        self.setIconSize(self.size())
-
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        self.updateImageSize()
-        self.applyBorderRadius()
-
-    def setImage(self, image=None):
-        if image is not None:
-            byte_array = QByteArray(image)
-            pixmap = QPixmap()
-            pixmap.loadFromData(byte_array)
-            self.image_original = pixmap
-            QTimer.singleShot(0, self.updateImageSize)
-            return True
-        return False
-
-    def updateImageSize(self):
-        if self.isVisible() and hasattr(self, "image_original"):
-            scaled_pixmap = self.image_original.scaled(self.size(), Qt.KeepAspectRatio)
-            self.setIcon(QIcon(scaled_pixmap))
-            self.setIconSize(QSize(*G.THUMBNAIL_SIZE))
-            self.setFixedSize(QSize(*G.THUMBNAIL_SIZE))
-
-    def applyHoverEffect(self, opacity):
-        effect = QGraphicsOpacityEffect()
-        effect.setOpacity(opacity)
-        self.setGraphicsEffect(effect)
-
-    def enterEvent(self, event):
-        self.applyHoverEffect(0.7)
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        self.applyHoverEffect(1.0)
-        super().leaveEvent(event)
-
-    def mousePressEvent(self, event):
-        self.applyHoverEffect(0.5)
-        super().mousePressEvent(event)
-
-    def mouseReleaseEvent(self, event):
-        self.applyHoverEffect(0.7)
-        super().mouseReleaseEvent(event)
-
-    def click(self, slot):
-        try:
-            self.clicked.disconnect()
-        except TypeError:
-            pass
-
-        self.clicked.connect(slot)
-
-
-class ProgressBar(QProgressBar, BaseWidget):
-    def __init__(self, parent=None, name=None, hor_policy=None, ver_policy=None):
-        QProgressBar.__init__(self, parent)
-        BaseWidget.__init__(self, parent, name, hor_policy, ver_policy)
-        self.setTextVisible(True)
-        self.setAlignment(Qt.AlignCenter)
-        self.setValue(0)
-
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        self.applyBorderRadius()
-
-    def config(self, value=None, range=None, text=None):
-        if value is not None:
-            self.setValue(value)
-
-        if range is not None:
-            self.setRange(0, range)
-
-        if text is not None:
-            self.setFormat(f"{text}: %p%")
-
-    def updateProgress(self, value, total, text=None):
-        if total > 0:
-            self.setValue(int((value / total) * 100))
-
-        if text is not None:
-            self.setFormat(f"{text}: %p%")
-
-
 class WebEnginePage(QWebEnginePage):
     def __init__(self, parent=None, intercept_callback=None):
         super().__init__(parent)
         self.intercept_callback = intercept_callback
+        self.console_callback = None
 
     def acceptNavigationRequest(self, url, _type, is_main_frame):
         if self.intercept_callback is not None:
@@ -323,7 +294,8 @@ class WebEnginePage(QWebEnginePage):
         return True
 
     def javaScriptConsoleMessage(self, level, message, lineNumber, sourceID):
-        pass
+        if self.console_callback is not None:
+            self.console_callback(message)
 
 
 class WebEngineView(QWebEngineView, BaseWidget):
@@ -380,7 +352,7 @@ class WebEngineView(QWebEngineView, BaseWidget):
                     image = buffer.data()
 
                     if not image.isNull() and self.image_select_callback:
-                        self.image_select_callback(resizeCoverImage(image))
+                        self.image_select_callback(bytes(image))
 
                 select_action = QAction("Select", menu)
                 select_action.triggered.connect(handleImage)
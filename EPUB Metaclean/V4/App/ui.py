@@ -3,104 +3,33 @@ from PyQt5.QtWidgets import QMainWindow, QApplication
 from PyQt5.QtGui import QIcon
 from qt_overrides import (
     Container,
-    ImageButton,
     Label,
-    ProgressBar,
     PushButton,
     WebEngineView,
-    ScrollContainer,
+    ListView,
     ImageLabel,
 )
+from book_list import BookItem, BookListModel, BookItemDelegate
 from helper_functions import resourcePath
 import os
+import re
 from globals import G
 
+STYLE_VARIABLE_PATTERN = re.compile(r"\{(\w+)\}")
 
-class UI(QMainWindow):
-    class BookItem(Container):
-        def __init__(self, ui, book, insert_index):
-            super().__init__(
-                ui.book_list_box.container,
-                name="list_item",
-                vertical=False,
-                insert_index=insert_index,
-            )
-            self.setMargins(*G.DEFAULT_MARGINS)
-            self.ui = ui
-            self.book = book
-
-            self.requeue_btn = PushButton(self, text=" ↺ ", theme="warn")
-            self.requeue_btn.click(self.requeueBook)
-            self.requeue_btn.hide()
-
-            self.cover = ImageButton(self, "list_item_cover")
-            self.cover.click(
-                lambda: ui.confirmAction(
-                    title=self.book.title, image=self.book.cover, info=True
-                )
-            )
-
-            self.details = Container(self, hor_policy=G.EXPANDING)
-            self.details.setSpacing(0)
-            self.title = Label(self.details)
-            self.author = Label(self.details)
-            self.series = Label(self.details)
-            self.series_index = Label(self.details)
-            self.progress_bar = ProgressBar(self.details)
-            self.progress_bar.hide()
-
-            self.updateData()
-
-            self.delete_btn = PushButton(self, text=" 🗑 ", theme="warn")
-            self.delete_btn.click(lambda: self.deleteBook())
-
-        def updateData(self):
-            if self.ui.notice.isVisible():
-                QTimer.singleShot(100, self.updateData)
-                return
-
-            if not G.download_worker and not G.upload_worker:
-                self.requeue_btn.setVisible(bool(self.book.meta_updated))
-            else:
-                self.requeue_btn.hide()
-
-            self.cover.setImage(self.book.cover)
-            self.cover.setVisible(bool(self.book.cover))
-            self.title.setText(self.book.title or self.book.file_name)
-            self.author.setText(
-                f"Author: {self.book.author}"
-                if self.book.author is not None
-                else None
-            )
-            self.series.setText(
-                f"Series: {self.book.series}"
-                if self.book.series is not None
-                else None
-            )
-            self.series_index.setText(
-                f"Book: #{self.book.series_index}"
-                if self.book.series_index is not None
-                else None
-            )
-
-            if self.progress_bar.value() == self.progress_bar.maximum():
-                self.progress_bar.hide()
-
-        def deleteBook(self):
-            cover_exists = False if self.book.cover is None else True
-            self.ui.confirmAction(
-                "Deleting Book",
-                "Would you like to delete the source file?",
-                lambda: (self.book.deleteBook(True)),
-                lambda: (self.book.deleteBook(False)),
-                warn_text=True,
-                warn_true=True,
-                image=self.book.cover if cover_exists else None,
-            )
 
-        def requeueBook(self):
-            self.book.requeue = True
-            self.requeue_btn.hide()
+class UI(QMainWindow):
+    BookItem = BookItem
+    UI_PARTS = {
+        "book_list": "updateBookList",
+        "select_downloads": "updateSelectDownloadsBtn",
+        "list_btns": "updateListSpecificBtns",
+        "task_btns": "updateTaskBtns",
+        "nav_btns": "updateNavBtns",
+        "task_label": "updateTaskLabel",
+        "book_items": "updateBookListItems",
+    }
+    DEFAULT_PARTS = tuple(part for part in UI_PARTS if part != "book_items")
 
     def __init__(self):
         super().__init__()
@@ -117,15 +46,23 @@ class UI(QMainWindow):
         self.hidden_engines_box.hide()
 
         self.style_variables = G.STYLE_VARIABLES
+        self.style_template = None
+        self.compiled_styles = {}
+        self.applied_style = None
         self.show_requeue = False
 
+        self.dirty_parts = set()
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.timeout.connect(self.refreshUIParts)
+
         self.initUI()
         self.initNoticePage()
         self.showMaximized()
         self.show()
 
         self.file_watcher = QFileSystemWatcher([G.STYLES_FILE])
-        self.file_watcher.fileChanged.connect(self.loadStyleSheet)
+        self.file_watcher.fileChanged.connect(self.styleSheetChanged)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -138,13 +75,36 @@ class UI(QMainWindow):
             f"{max(14, screen_size.height()//90)}px"
         )
 
-    def loadStyleSheet(self):
-        with open(resourcePath(G.STYLES_FILE), "r") as styles:
-            style_sheet = styles.read()
+    def styleSheetChanged(self, path):
+        if path not in self.file_watcher.files() and os.path.exists(path):
+            self.file_watcher.addPath(path)
+
+        self.style_template = None
+        self.compiled_styles = {}
+        self.loadStyleSheet()
 
-        for var, value in self.style_variables.items():
-            style_sheet = style_sheet.replace(f"{{{var}}}", str(value))
+    def compileStyleSheet(self):
+        key = tuple(sorted(self.style_variables.items()))
+        if key in self.compiled_styles:
+            return self.compiled_styles[key]
 
+        if self.style_template is None:
+            with open(resourcePath(G.STYLES_FILE), "r") as styles:
+                self.style_template = styles.read()
+
+        style_sheet = STYLE_VARIABLE_PATTERN.sub(
+            lambda m: str(self.style_variables.get(m.group(1), m.group(0))),
+            self.style_template,
+        )
+        self.compiled_styles[key] = style_sheet
+        return style_sheet
+
+    def loadStyleSheet(self):
+        style_sheet = self.compileStyleSheet()
+        if style_sheet is self.applied_style:
+            return
+
+        self.applied_style = style_sheet
         self.setStyleSheet(style_sheet)
 
     def initUI(self):
@@ -180,13 +140,12 @@ class UI(QMainWindow):
             self.center_box, "web_engine", hor_policy=G.EXPANDING
         )
         self.web_engine.hide()
-        self.book_list_box = ScrollContainer(self.center_box, "book_list_box")
-        self.book_list_box.container.setSpacing(5)
+        self.book_list_box = ListView(self.center_box, "book_list_box")
         self.book_list_box.setMinimumWidth(G.MINIMUM_SIZE[0])
-        self.book_list_spacer = Label(
-            self.book_list_box.container,
-            "book_list_spacer",
-            ver_policy=G.EXPANDING,
+        self.book_list_model = BookListModel(self.book_list_box)
+        self.book_list_box.setModel(self.book_list_model)
+        self.book_list_box.setItemDelegate(
+            BookItemDelegate(self.book_list_box)
         )
 
         self.book_options_box = Container(
@@ -256,7 +215,7 @@ class UI(QMainWindow):
         self.showNotice()
         self.notice_title.setText(title)
 
-        self.notice_image.setImage(image)
+        self.notice_image.setImage(G.cover_store.pixmap(image))
 
         self.notice_text.setText(text)
         self.notice_text.setTheme("warn" if warn_text else None)
@@ -275,113 +234,94 @@ class UI(QMainWindow):
             lambda: (QTimer.singleShot(50, action_false), self.showContent())
         )
 
-        self.loadStyleSheet()
+    def updateUIParts(self, *parts):
+        self.dirty_parts.update(parts or self.DEFAULT_PARTS)
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start(50)
 
-    def updateUIParts(self):
+    def refreshUIParts(self):
         if self.notice.isVisible():
-            QTimer.singleShot(100, self.updateUIParts)
+            self.refresh_timer.start(100)
             return
 
-        QTimer.singleShot(
-            50,
-            lambda: (
-                self.loadStyleSheet(),
-                updateBookList(),
-                updateSelectDownloadsBtn(),
-                updateListSpecificBtns(),
-                updateTaskBtns(),
-                updateNavBtn1(),
-                updateNavBtn2(),
-                updateNavBtns(),
-                updateTaskLabel(),
-                updateBookListItems(),
-            ),
-        )
+        parts, self.dirty_parts = self.dirty_parts, set()
+        for part in self.UI_PARTS:
+            if part in parts:
+                getattr(self, self.UI_PARTS[part])()
 
-        def updateBookList():
-            self.book_list_box.hide()
-            if G.download_worker and not G.books:
-                return
-            self.book_list_box.show()
-
-        def updateSelectDownloadsBtn():
-            self.select_downloads_btn.hide()
-            files = [
-                f
-                for f in os.listdir(G.DOWNLOAD_LOCATION)
-                if f.endswith(".epub")
-            ]
-            if not files:
-                return
-            self.select_downloads_btn.show()
-
-        def updateListSpecificBtns():
-            self.process_task_btn.hide()
-            self.upload_task_btn.hide()
-            self.clear_all_btn.hide()
+    def updateBookList(self):
+        self.book_list_box.hide()
+        if G.download_worker and not G.books:
+            return
+        self.book_list_box.show()
+        self.book_list_box.viewport().update()
+
+    def updateSelectDownloadsBtn(self):
+        self.select_downloads_btn.setVisible(bool(G.download_folder))
+
+    def updateListSpecificBtns(self):
+        self.process_task_btn.hide()
+        self.upload_task_btn.hide()
+        self.clear_all_btn.hide()
+        if not G.books:
+            return
+        self.process_task_btn.show()
+        self.upload_task_btn.show()
+        self.clear_all_btn.show()
+
+    def updateTaskBtns(self):
+        self.task_btns_box.hide()
+        self.book_options_box.hide()
+        if G.download_worker or G.process_worker or G.upload_worker:
+            return
+        self.task_btns_box.show()
+        self.book_options_box.show()
+
+    def updateNavBtns(self):
+        self.nav_btn_1.setVisible(self.showNavBtn1())
+        self.nav_btn_2.setVisible(G.download_worker is None)
+        self.nav_btns_box.setVisible(self.web_engine.isVisible())
+
+    def showNavBtn1(self):
+        if G.download_worker is not None:
             if not G.books:
-                return
-            self.process_task_btn.show()
-            self.upload_task_btn.show()
-            self.clear_all_btn.show()
-
-        def updateTaskBtns():
-            self.task_btns_box.hide()
-            self.book_options_box.hide()
-            if G.download_worker or G.process_worker or G.upload_worker:
-                return
-            self.task_btns_box.show()
-            self.book_options_box.show()
-
-        def updateNavBtn1():
-            self.nav_btn_1.hide()
-            if G.download_worker is not None:
-                if not G.books:
-                    return
-                if any(book.download is None for book in G.books):
-                    return
-                if any(
-                    book.download and not book.download.isFinished()
-                    for book in G.books
-                ):
-                    return
-
-            if G.process_worker is not None:
-                if not G.process_worker.show_select:
-                    return
-
-            self.nav_btn_1.show()
-
-        def updateNavBtn2():
-            self.nav_btn_2.hide()
-            if G.download_worker is not None:
-                return
-            self.nav_btn_2.show()
-
-        def updateNavBtns():
-            self.nav_btns_box.hide()
-            if not self.web_engine.isVisible():
-                return
-            self.nav_btns_box.show()
-
-        def updateTaskLabel():
-            self.task_label_box.hide()
-            if G.download_worker is not None:
-                self.task_label.setText("Downloading New Books")
-            if G.process_worker is not None:
-                self.task_label.setText("Processing Books")
-            if G.upload_worker is not None:
-                self.task_label.setText("Uploading Books")
-
-            if (
-                not G.download_worker
-                and not G.process_worker
-                and not G.upload_worker
+                return False
+            if any(book.download is None for book in G.books):
+                return False
+            if any(
+                book.download and not book.download.isFinished()
+                for book in G.books
             ):
-                return
-            self.task_label_box.show()
+                return False
+
+        if G.process_worker is not None:
+            if not G.process_worker.show_select:
+                return False
+
+        return True
+
+    def updateTaskLabel(self):
+        self.task_label_box.hide()
+        if G.download_worker is not None:
+            self.task_label.setText("Downloading New Books")
+        if G.process_worker is not None:
+            self.task_label.setText(
+                "Processing Books"
+                if not G.process_worker.clean_summary
+                else f"Processing Books - {G.process_worker.clean_summary}"
+            )
+        if G.upload_worker is not None:
+            self.task_label.setText("Uploading Books")
+
+        if (
+            not G.download_worker
+            and not G.process_worker
+            and not G.upload_worker
+        ):
+            return
+        self.task_label_box.show()
 
-        def updateBookListItems():
-            for book in G.books:
-                if book.list_item is not None:
-                    book.list_item.updateData()
+    def updateBookListItems(self):
+        for book in G.books:
+            if book.list_item is not None:
+                book.list_item.updateData()
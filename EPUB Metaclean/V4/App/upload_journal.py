@@ -0,0 +1,78 @@
+import os
+import json
+import tempfile
+
+
+def fileKey(file_path):
+    stat = os.stat(file_path)
+    return f"{os.path.normpath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+
+def makeBatches(file_paths, max_bytes, max_files):
+    batches = []
+    batch = []
+    batch_bytes = 0
+    for file_path in file_paths:
+        try:
+            size = os.path.getsize(file_path)
+        except OSError as e:
+            print(f"Skipping missing upload file: {e}")
+            continue
+        if batch and (
+            batch_bytes + size > max_bytes or len(batch) >= max_files
+        ):
+            batches.append(batch)
+            batch = []
+            batch_bytes = 0
+        batch.append(file_path)
+        batch_bytes += size
+
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class UploadJournal:
+    def __init__(self, journal_path):
+        self.journal_path = journal_path
+        self.uploaded = set()
+        self.load()
+
+    def __len__(self):
+        return len(self.uploaded)
+
+    def load(self):
+        try:
+            with open(self.journal_path, "r") as journal:
+                self.uploaded = set(json.load(journal).get("uploaded", []))
+        except (OSError, ValueError):
+            self.uploaded = set()
+
+    def save(self):
+        fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(self.journal_path) or "."
+        )
+        with os.fdopen(fd, "w") as journal:
+            json.dump({"uploaded": sorted(self.uploaded)}, journal)
+        os.replace(temp_path, self.journal_path)
+
+    def isUploaded(self, file_path):
+        try:
+            return fileKey(file_path) in self.uploaded
+        except OSError:
+            return False
+
+    def markUploaded(self, file_paths):
+        for file_path in file_paths:
+            try:
+                self.uploaded.add(fileKey(file_path))
+            except OSError:
+                continue
+        self.save()
+
+    def clear(self):
+        self.uploaded = set()
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
@@ -19,6 +19,7 @@ a = Analysis(
         'PIL.Image',
         'bs4',
         'requests',
+        'psutil',
     ],
     hookspath=[],
     hooksconfig={},
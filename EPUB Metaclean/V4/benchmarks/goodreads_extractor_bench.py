@@ -0,0 +1,54 @@
+import os
+import sys
+import glob
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "App"))
+
+from bs4 import BeautifulSoup
+from goodreads_extractor import extractGoodreadsData
+
+PAGES_FOLDER = os.path.join(os.path.dirname(__file__), "pages")
+SYNTHETIC_PREFIX = "synthetic_"
+RUNS = 20
+
+
+def soupExtract(html):
+    soup = BeautifulSoup(html, "html.parser")
+    return (
+        soup.select(".Text__title1")[0].text.strip(),
+        soup.select(".ContributorLink__name")[0].text.strip(),
+        soup.select_one('a[href^="https://www.goodreads.com/series"]'),
+        soup.select(".BookCover__image")[0].select("img")[0]["src"],
+    )
+
+
+def benchmark(page_path):
+    with open(page_path, "r", encoding="utf-8") as page:
+        html = page.read()
+
+    fast = timeit.timeit(lambda: extractGoodreadsData(html), number=RUNS)
+    soup = timeit.timeit(lambda: soupExtract(html), number=RUNS)
+
+    name = os.path.basename(page_path)
+    label = " [synthetic]" if name.startswith(SYNTHETIC_PREFIX) else ""
+    print(f"{name} ({len(html) // 1024} KB){label}")
+    print(f"  extractor: {fast / RUNS * 1000:.2f} ms")
+    print(f"  soup:      {soup / RUNS * 1000:.2f} ms")
+    print(f"  fields:    {extractGoodreadsData(html)}")
+
+
+if __name__ == "__main__":
+    pages = sys.argv[1:] or sorted(glob.glob(os.path.join(PAGES_FOLDER, "*.html")))
+    if not pages:
+        print(f"Save Goodreads book pages as .html files in {PAGES_FOLDER}")
+        sys.exit(1)
+
+    if all(os.path.basename(p).startswith(SYNTHETIC_PREFIX) for p in pages):
+        print(
+            "Only synthetic pages found; save real Goodreads book pages in "
+            f"{PAGES_FOLDER} for representative timings.\n"
+        )
+
+    for page_path in pages:
+        benchmark(page_path)